@@ -0,0 +1,237 @@
+# async_list.py
+# ===================================================
+# asyncio awaitable deque built on CircularList
+# ===================================================
+
+import asyncio
+import collections
+
+from linked_list import CircularList
+
+
+class AsyncCircularList:
+    def __init__(self, start_list=None, capacity=None):
+        """
+        Initializes a deque for use from a single asyncio event loop. Callers
+        that need data or room are suspended on a future and woken by the
+        call that makes it available, so nothing polls the list.
+
+        Args:
+            start_list: The values to populate the deque with (optional)
+            capacity: The most values the deque will hold before puts wait
+            (optional, no limit by default)
+        """
+        if capacity is not None and capacity < 1:
+            raise Exception('Capacity must be at least 1')
+
+        self._list = CircularList(start_list)
+        self.capacity = capacity
+
+        # futures of the coroutines waiting for data and for room, oldest first
+        self._getters = collections.deque()
+        self._putters = collections.deque()
+
+    def __len__(self):
+        """
+        Returns the number of values in the deque
+
+        Returns:
+            The number of elements in the deque
+        """
+        return len(self._list)
+
+    def __str__(self):
+        """
+        Returns a human readable string of the deque content of the form
+        [value1 <-> value2 <-> value3]
+
+        Returns:
+            The string of the human readable deque representation
+        """
+        return str(self._list)
+
+    def is_empty(self):
+        """
+        Checks if the deque is empty
+
+        Returns:
+            True if the deque has no values, False otherwise
+        """
+        return self._list.is_empty()
+
+    def is_full(self):
+        """
+        Checks if the deque is at capacity
+
+        Returns:
+            True if a put would have to wait, False otherwise
+        """
+        return self.capacity is not None and len(self._list) >= self.capacity
+
+    def get_front(self):
+        """
+        Returns the value at the front of the deque without waiting. Will
+        return None in an empty deque.
+
+        Returns:
+            The value at index 0 or None if there is no such value
+        """
+        return self._list.get_front()
+
+    def get_back(self):
+        """
+        Returns the value at the end of the deque without waiting. Will return
+        None in an empty deque.
+
+        Returns:
+            The value at the last index or None if there is no such value
+        """
+        return self._list.get_back()
+
+    @staticmethod
+    def _wakeup_next(waiters):
+        """
+        Wakes the oldest waiter that is still waiting
+
+        Args:
+            waiters: The deque of futures to wake from
+        """
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+    async def _wait(self, waiters, ready):
+        """
+        Suspends the caller until ready() is True. If the caller is cancelled
+        after being woken, the wake up is handed on to the next waiter so it
+        isn't lost.
+
+        Args:
+            waiters: The deque of futures to wait in
+            ready: A function that returns True once the caller can go ahead
+        """
+        while not ready():
+            waiter = asyncio.get_running_loop().create_future()
+            waiters.append(waiter)
+            try:
+                await waiter
+            except BaseException:
+                waiter.cancel()
+                try:
+                    waiters.remove(waiter)
+                except ValueError:
+                    pass
+                if ready() and not waiter.cancelled():
+                    self._wakeup_next(waiters)
+                raise
+
+    def _has_data(self):
+        """
+        Returns:
+            True if there is a value to take, False otherwise
+        """
+        return not self._list.is_empty()
+
+    def _has_room(self):
+        """
+        Returns:
+            True if there is room to put a value, False otherwise
+        """
+        return not self.is_full()
+
+    async def get_front_wait(self):
+        """
+        Returns the value at the front of the deque without removing it,
+        waiting for one to arrive if the deque is empty
+
+        Returns:
+            The value at index 0
+        """
+        await self._wait(self._getters, self._has_data)
+
+        # we didn't take anything, so the next waiter can have a look too
+        self._wakeup_next(self._getters)
+        return self._list.get_front()
+
+    async def put_front(self, data):
+        """
+        Adds a value at the beginning of the deque, waiting for room if the
+        deque is at capacity
+
+        Args:
+            data: The value to add
+        """
+        await self._wait(self._putters, self._has_room)
+        self._list.add_front(data)
+        self._wakeup_next(self._getters)
+
+    async def put_back(self, data):
+        """
+        Adds a value at the end of the deque, waiting for room if the deque is
+        at capacity
+
+        Args:
+            data: The value to add
+        """
+        await self._wait(self._putters, self._has_room)
+        self._list.add_back(data)
+        self._wakeup_next(self._getters)
+
+    async def pop_front(self):
+        """
+        Removes and returns the value at the front of the deque, waiting for
+        one to arrive if the deque is empty
+
+        Returns:
+            The value that was at the front of the deque
+        """
+        await self._wait(self._getters, self._has_data)
+        data = self._list.get_front()
+        self._list.remove_front()
+        self._wakeup_next(self._putters)
+        return data
+
+    async def pop_back(self):
+        """
+        Removes and returns the value at the end of the deque, waiting for one
+        to arrive if the deque is empty
+
+        Returns:
+            The value that was at the end of the deque
+        """
+        await self._wait(self._getters, self._has_data)
+        data = self._list.get_back()
+        self._list.remove_back()
+        self._wakeup_next(self._putters)
+        return data
+
+    async def pop_many(self, n):
+        """
+        Removes and returns up to n values from the front of the deque. Waits
+        only until at least one value is there, then takes whatever is
+        available, so a busy consumer is woken once per batch instead of once
+        per value.
+
+        Args:
+            n: The most values to take
+
+        Returns:
+            A python list of the values taken, in order
+        """
+        if n < 1:
+            raise Exception('n must be at least 1')
+
+        await self._wait(self._getters, self._has_data)
+        batch = []
+        while len(batch) < n and not self._list.is_empty():
+            batch.append(self._list.get_front())
+            self._list.remove_front()
+
+        # every value taken makes room for one waiting put
+        for number in range(len(batch)):
+            if not self._putters:
+                break
+            self._wakeup_next(self._putters)
+        return batch
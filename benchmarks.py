@@ -0,0 +1,864 @@
+# benchmarks.py
+# ===================================================
+# Benchmarks for the linked list implementations
+# Run with: python benchmarks.py [suite] [memory] [threads] [persist] ...
+#
+# The suite times every public operation of LinkedList and CircularList next
+# to collections.deque and list, and can write the results as JSON and compare
+# them against a stored baseline:
+#
+#   python benchmarks.py suite --json results.json
+#   python benchmarks.py suite --baseline benchmarks_baseline.json
+#   python benchmarks.py suite --baseline benchmarks_baseline.json --update \
+#       --runs 5
+#
+# Timings depend on the machine, so refresh the baseline with --update when
+# moving to a new one. The baseline holds the median of several runs, each in
+# its own process, since some timings move a lot from process to process.
+# ===================================================
+
+import argparse
+import collections
+import functools
+import gc
+import json
+import operator
+import os
+import pickle
+import platform
+import queue
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+
+from concurrent_list import ConcurrentCircularList, VersionedLinkedList
+from linked_list import LinkedList, CircularList
+from persistent_list import PersistentDeque
+
+
+def bytes_per_element(list_class, size):
+    """
+    Measures how much memory a list of size small ints takes per element
+
+    Args:
+        list_class: The list class to build
+        size: The number of elements to put in the list
+
+    Returns:
+        The number of bytes allocated per element
+    """
+
+    # the values are built before tracing starts so only the list is measured
+    values = list(range(size))
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    built = list_class(values)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    # keep the list alive until we've taken our measurement
+    del built
+    return (after - before) / size
+
+
+def bench_memory(sizes=(10 ** 3, 10 ** 5, 10 ** 6)):
+    """
+    Prints the bytes per element for both list classes at each size
+
+    Args:
+        sizes: The list sizes to measure
+    """
+    for list_class in (LinkedList, CircularList):
+        for size in sizes:
+            print('memory  %-13s n=%-8d %6.1f bytes/element'
+                  % (list_class.__name__, size,
+                     bytes_per_element(list_class, size)))
+
+
+def _run_threads(put, get, producers, consumers, items):
+    """
+    Pushes items values through a shared deque with several producer and
+    consumer threads, and checks every value came out exactly once
+
+    Args:
+        put: The function producers call with each value
+        get: The function consumers call to take a value
+        producers: The number of producer threads
+        consumers: The number of consumer threads
+        items: The number of values each producer sends
+
+    Returns:
+        The number of seconds the run took
+    """
+    total = producers * items
+    per_consumer = [total // consumers] * consumers
+    per_consumer[0] += total - sum(per_consumer)
+    received = [[] for number in range(consumers)]
+
+    def produce(offset):
+        for value in range(offset, offset + items):
+            put(value)
+
+    def consume(bucket, count):
+        for number in range(count):
+            bucket.append(get())
+
+    threads = [threading.Thread(target=produce, args=(p * items,))
+               for p in range(producers)]
+    threads += [threading.Thread(target=consume,
+                                 args=(received[c], per_consumer[c]))
+                for c in range(consumers)]
+
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    seen = sorted(value for bucket in received for value in bucket)
+    assert seen == list(range(total)), 'values were lost or duplicated'
+    return elapsed
+
+
+def bench_concurrent(producers=4, consumers=4, items=50000, capacity=1000):
+    """
+    Stress tests ConcurrentCircularList with several threads and prints its
+    throughput next to queue.Queue doing the same work
+
+    Args:
+        producers: The number of producer threads
+        consumers: The number of consumer threads
+        items: The number of values each producer sends
+        capacity: The capacity of both queues, so producers see backpressure
+    """
+    deque = ConcurrentCircularList(capacity=capacity)
+    std = queue.Queue(maxsize=capacity)
+    total = producers * items
+
+    for name, put, get in (
+            ('ConcurrentCircularList', deque.add_back, deque.pop_front),
+            ('queue.Queue', std.put, std.get)):
+        elapsed = _run_threads(put, get, producers, consumers, items)
+        print('threads %-22s %dx%d %8.0f items/s'
+              % (name, producers, consumers, total / elapsed))
+
+
+def bench_persistent(size=200000):
+    """
+    Fills a PersistentDeque, checks it comes back after a clean close and
+    after a crash that loses the changes made since the last flush, and prints
+    how long each step took
+
+    Args:
+        size: The number of values to write
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'deque.bin')
+
+        start = time.perf_counter()
+        deque = PersistentDeque(path)
+        for value in range(size):
+            deque.add_back(value)
+        deque.close()
+        write_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        deque = PersistentDeque(path)
+        reopen_time = time.perf_counter() - start
+        if len(deque) != size or deque.get_front() != 0 or \
+                deque.get_back() != size - 1:
+            raise Exception('clean reopen lost values')
+
+        # change the deque without flushing and drop it, like a crash would
+        for number in range(size // 2):
+            deque.remove_front()
+            deque.add_front(-1)
+        deque._map.close()
+        deque._file.close()
+
+        deque = PersistentDeque(path)
+        if list(deque) != list(range(size)):
+            raise Exception('recovery did not roll back')
+        deque.close()
+
+        print('persist n=%-8d write %.2fs  reopen %.4fs  file %d bytes'
+              % (size, write_time, reopen_time, os.path.getsize(path)))
+
+
+def bench_snapshot(size=10 ** 6):
+    """
+    Round trips both list types through dump/load and through pickle, checks
+    the values come back in order, and prints the time and size of each
+
+    Args:
+        size: The number of values in each list
+    """
+    values = list(range(size))
+    for cls in (LinkedList, CircularList):
+        original = cls(values)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'snapshot.bin')
+
+            start = time.perf_counter()
+            with open(path, 'wb') as fp:
+                original.dump(fp)
+            dump_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            with open(path, 'rb') as fp:
+                restored = cls.load(fp)
+            load_time = time.perf_counter() - start
+            file_size = os.path.getsize(path)
+
+        assert list(restored) == values, 'dump/load changed the values'
+
+        # pickle goes through __reduce__ so it doesn't recurse down the Nodes
+        start = time.perf_counter()
+        blob = pickle.dumps(original, pickle.HIGHEST_PROTOCOL)
+        copy = pickle.loads(blob)
+        pickle_time = time.perf_counter() - start
+        assert list(copy) == values, 'pickle changed the values'
+
+        print('snapshot %-12s n=%-8d dump %.3fs  load %.3fs  file %d bytes  '
+              'pickle round trip %.3fs (%d bytes)'
+              % (cls.__name__, size, dump_time, load_time, file_size,
+                 pickle_time, len(blob)))
+
+
+def bench_sort(size=10 ** 6):
+    """
+    Prints the time and peak extra memory of sorting each list type in place
+    next to copying the values out with sorted() and building a new list
+
+    Args:
+        size: The number of values in each list
+    """
+    values = list(range(size))
+    random.Random(0).shuffle(values)
+    expected = sorted(values)
+
+    def in_place(unsorted):
+        unsorted.sort()
+        return unsorted
+
+    def rebuild(unsorted):
+        return type(unsorted)(sorted(unsorted))
+
+    for cls in (LinkedList, CircularList):
+        for name, run in (('sort', in_place), ('sorted+rebuild', rebuild)):
+
+            # tracemalloc slows every allocation down, so the time and the
+            # memory come from separate runs
+            unsorted = cls(values)
+            start = time.perf_counter()
+            result = run(unsorted)
+            elapsed = time.perf_counter() - start
+            assert list(result) == expected, '%s gave the wrong order' % name
+            del unsorted, result
+
+            unsorted = cls(values)
+            tracemalloc.start()
+            result = run(unsorted)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            del unsorted, result
+
+            print('sort    %-12s n=%-8d %-15s %.2fs  peak +%.1f MB'
+                  % (cls.__name__, size, name, elapsed, peak / 2 ** 20))
+
+
+def bench_versions(size=10 ** 5, readers=4, duration=1.0):
+    """
+    Prints what a reader pays for a consistent view of a shared list, taking a
+    snapshot of a VersionedLinkedList next to copying a LinkedList under a
+    lock, and then the throughput of one writer and several readers running
+    together with each
+
+    Args:
+        size: The number of values in the shared list
+        readers: The number of reader threads
+        duration: The seconds each throughput run lasts
+    """
+    versioned = VersionedLinkedList(range(size))
+    locked = LinkedList(range(size))
+    lock = threading.Lock()
+
+    def take_snapshot():
+        return versioned.snapshot()
+
+    def copy_locked():
+        with lock:
+            return list(locked)
+
+    for name, take, calls in (('snapshot', take_snapshot, 100000),
+                              ('lock+copy', copy_locked, 20)):
+        start = time.perf_counter()
+        for number in range(calls):
+            take()
+        elapsed = (time.perf_counter() - start) / calls
+        print('versions %-10s n=%-8d %12.3f us per view'
+              % (name, size, elapsed * 1e6))
+
+    def versioned_write(data):
+        versioned.add_front(data)
+        versioned.remove_front()
+
+    def locked_write(data):
+        with lock:
+            locked.add_front(data)
+            locked.remove_front()
+
+    for name, write, take in (('snapshot', versioned_write, take_snapshot),
+                              ('lock+copy', locked_write, copy_locked)):
+        stop = threading.Event()
+        counts = {'writes': 0, 'reads': 0}
+        count_lock = threading.Lock()
+
+        def writer():
+            writes = 0
+            while not stop.is_set():
+                write(writes)
+                writes += 1
+            with count_lock:
+                counts['writes'] += writes
+
+        def reader():
+            reads = 0
+            while not stop.is_set():
+                view = take()
+
+                # every view has to be a whole version, never a half change
+                assert sum(1 for data in view) in (size, size + 1), \
+                    'a reader saw an inconsistent view'
+                reads += 1
+            with count_lock:
+                counts['reads'] += reads
+
+        threads = [threading.Thread(target=writer)]
+        threads += [threading.Thread(target=reader) for number in range(readers)]
+        for thread in threads:
+            thread.start()
+        time.sleep(duration)
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+        print('versions %-10s n=%-8d 1 writer %10.0f writes/s  %d readers '
+              '%8.1f reads/s'
+              % (name, size, counts['writes'] / duration, readers,
+                 counts['reads'] / duration))
+
+
+def bench_numeric(sizes=(10 ** 6, 10 ** 7)):
+    """
+    Prints memory use, build time and scan times of NumericDeque next to
+    CircularList holding the same floats
+
+    Args:
+        sizes: The number of values to store
+    """
+
+    # NumPy is only needed for this benchmark
+    import numpy as np
+    from numeric_list import NumericDeque
+
+    for size in sizes:
+        values = np.arange(size, dtype=np.float64)
+        for name, build in (
+                ('CircularList', lambda: CircularList(values.tolist())),
+                ('NumericDeque', lambda: NumericDeque(values))):
+            start = time.perf_counter()
+            built = build()
+            build_time = time.perf_counter() - start
+
+            # -1.0 is never there, so contains has to look at every value
+            start = time.perf_counter()
+            built.contains(-1.0)
+            contains_time = time.perf_counter() - start
+            del built
+
+            # build it again under tracemalloc, which would skew the timings
+            tracemalloc.start()
+            built = build()
+            memory = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+
+            print('numeric %-13s n=%-9d %6.1f bytes/element  build %.3fs  '
+                  'contains %.4fs'
+                  % (name, size, memory / size, build_time, contains_time))
+            del built
+
+
+# ----- operation suite -----
+
+SUITE_SIZES = (10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6)
+SUITE_STRUCTURES = ('LinkedList', 'CircularList', 'deque', 'list')
+
+
+def _build(structure, size):
+    """
+    Builds one of the suite structures holding 0 to size - 1
+
+    Args:
+        structure: One of SUITE_STRUCTURES
+        size: The number of values
+
+    Returns:
+        The new structure
+    """
+    values = range(size)
+    if structure == 'LinkedList':
+        return LinkedList(values)
+    if structure == 'CircularList':
+        return CircularList(values)
+    if structure == 'deque':
+        return collections.deque(values)
+    return list(values)
+
+
+def _bind(structure, obj, op, size):
+    """
+    Works out how a structure performs an operation
+
+    Args:
+        structure: One of SUITE_STRUCTURES
+        obj: The structure built by _build
+        op: The name of the operation, as named on the linked lists
+        size: The number of values in obj
+
+    Returns:
+        A tuple of a function doing the operation once and a function that
+        undoes it once (None when nothing needs undoing), or None if the
+        structure doesn't have the operation
+    """
+    mid = size // 2
+    linked = structure in ('LinkedList', 'CircularList')
+    partial = functools.partial
+
+    # the positional operations go to a different index on every call. A
+    # CircularList keeps a cursor on the last Node it found by index, so
+    # calls that all go to mid would only time a step or two of walking.
+    # Every index stays in range while a batch grows or shrinks the structure
+    # by up to a quarter.
+    positions = random.Random(size).choices(range(max(1, size * 3 // 4)),
+                                            k=1024)
+
+    if op == 'add_front':
+        if linked:
+            return partial(obj.add_front, -1), obj.remove_front
+        if structure == 'deque':
+            return partial(obj.appendleft, -1), obj.popleft
+        return partial(obj.insert, 0, -1), partial(obj.pop, 0)
+
+    if op == 'add_back':
+        # remove_back walks the whole of a LinkedList, so undoing would take
+        # far longer than the timed calls. The list is left to grow instead,
+        # which add_back doesn't care about.
+        if structure == 'LinkedList':
+            return partial(obj.add_back, -1), None
+        if linked:
+            return partial(obj.add_back, -1), obj.remove_back
+        return partial(obj.append, -1), obj.pop
+
+    if op == 'remove_front':
+        if linked:
+            return obj.remove_front, partial(obj.add_front, 0)
+        if structure == 'deque':
+            return obj.popleft, partial(obj.appendleft, 0)
+        return partial(obj.pop, 0), partial(obj.insert, 0, 0)
+
+    if op == 'remove_back':
+        if linked:
+            return obj.remove_back, partial(obj.add_back, 0)
+        return obj.pop, partial(obj.append, 0)
+
+    if op == 'get_front':
+        if linked:
+            return obj.get_front, None
+        return partial(operator.getitem, obj, 0), None
+
+    if op == 'get_back':
+        if linked:
+            return obj.get_back, None
+        return partial(operator.getitem, obj, -1), None
+
+    if op == 'is_empty':
+        if linked:
+            return obj.is_empty, None
+        return partial(operator.not_, obj), None
+
+    # -1 is never in the list, so this is the worst case full scan
+    if op == 'contains':
+        if linked:
+            return partial(obj.contains, -1), None
+        return partial(operator.contains, obj, -1), None
+
+    # each call removes the next value along from the middle, so every call
+    # scans half the list, and the undo puts them back in the same spot
+    if op == 'remove':
+        removed = []
+        insert = obj.add_link_before if linked else \
+            (lambda data, index: obj.insert(index, data))
+
+        def run():
+            data = mid + len(removed)
+            obj.remove(data)
+            removed.append(data)
+
+        def undo():
+            insert(removed.pop(), mid)
+
+        return run, undo
+
+    # the undos go back through the indexes in reverse, which puts every
+    # value back where it was
+    if op in ('add_link_before', 'remove_link'):
+        if linked:
+            insert = obj.add_link_before
+            delete = obj.remove_link
+        else:
+            insert = (lambda data, index: obj.insert(index, data))
+            delete = partial(operator.delitem, obj)
+        done = []
+
+        if op == 'add_link_before':
+            def run():
+                index = positions[len(done) % 1024]
+                insert(-1, index)
+                done.append(index)
+
+            def undo():
+                delete(done.pop())
+        else:
+            def run():
+                index = positions[len(done) % 1024]
+                delete(index)
+                done.append(index)
+
+            def undo():
+                insert(0, done.pop())
+
+        return run, undo
+
+    if op == '__str__':
+        return partial(str, obj), None
+
+    if op == 'circularListReverse':
+        if structure == 'LinkedList':
+            return None
+        if structure == 'CircularList':
+            return obj.circularListReverse, None
+        return obj.reverse, None
+
+    raise Exception('Unknown operation %s' % op)
+
+
+SUITE_OPERATIONS = ('add_front', 'add_back', 'remove_front', 'remove_back',
+                    'get_front', 'get_back', 'is_empty', 'contains', 'remove',
+                    'add_link_before', 'remove_link', '__str__',
+                    'circularListReverse')
+
+
+def _time_operation(run, undo, size, min_time, repeats):
+    """
+    Times one operation, doubling the number of calls in a batch until a batch
+    takes at least min_time. Each batch is undone (untimed) before the next so
+    the structure stays at size.
+
+    Args:
+        run: Does the operation once
+        undo: Undoes the operation once, or None
+        size: The number of values in the structure
+        min_time: The shortest batch, in seconds, worth trusting
+        repeats: How many batches to time at the final batch size
+
+    Returns:
+        The median time per call, in seconds
+    """
+
+    # a batch of removals must leave the indexes the operations use in
+    # range, so an operation that gets undone is held to a quarter of the
+    # size. The rest, reads mostly, take as many calls as min_time needs.
+    most_calls = max(1, size // 4) if undo is not None else float('inf')
+    perf_counter = time.perf_counter
+
+    def batch(calls):
+        start = perf_counter()
+        for number in range(calls):
+            run()
+        elapsed = perf_counter() - start
+        if undo is not None:
+            for number in range(calls):
+                undo()
+        return elapsed
+
+    # like timeit, keep the garbage collector out of the timings. Whether a
+    # collection of the whole heap lands inside a batch is down to luck and
+    # would swamp the operations that allocate.
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        calls = 1
+        elapsed = batch(calls)
+        while elapsed < min_time and calls < most_calls:
+            calls = min(calls * 2, most_calls)
+            elapsed = batch(calls)
+
+        # the median rather than the fastest batch, so one lucky batch in the
+        # baseline doesn't make every later run look slow
+        timings = [elapsed]
+        for number in range(repeats - 1):
+            timings.append(batch(calls))
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return statistics.median(timings) / calls
+
+
+def run_suite(sizes=SUITE_SIZES, structures=SUITE_STRUCTURES,
+              operations=SUITE_OPERATIONS, min_time=0.02, repeats=5):
+    """
+    Times every operation on every structure at every size
+
+    Args:
+        sizes: The structure sizes to time at
+        structures: The structures to time, from SUITE_STRUCTURES
+        operations: The operations to time, from SUITE_OPERATIONS
+        min_time: The shortest batch, in seconds, worth trusting
+        repeats: How many batches to take the median of
+
+    Returns:
+        A dictionary of the form
+        {'meta': {...}, 'results': {structure: {op: {size: seconds}}}}
+    """
+    results = {}
+    for structure in structures:
+        results[structure] = {}
+        for size in sizes:
+            for op in operations:
+                # a fresh structure for every operation, since the undos only
+                # keep the size right and not every value
+                obj = _build(structure, size)
+                bound = _bind(structure, obj, op, size)
+                if bound is None:
+                    continue
+                run, undo = bound
+                seconds = _time_operation(run, undo, size, min_time, repeats)
+                results[structure].setdefault(op, {})[str(size)] = seconds
+                del obj, bound, run, undo
+
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'sizes': list(sizes),
+        },
+        'results': results,
+    }
+
+
+def print_suite(report):
+    """
+    Prints the suite results as a table of microseconds per call, one row per
+    operation and size
+
+    Args:
+        report: The dictionary returned by run_suite
+    """
+    results = report['results']
+    structures = list(results)
+    print('%-20s %8s ' % ('operation', 'n') +
+          ' '.join('%13s' % name for name in structures) + '   (us/call)')
+
+    for op in SUITE_OPERATIONS:
+        for size in report['meta']['sizes']:
+            row = []
+            for structure in structures:
+                seconds = results[structure].get(op, {}).get(str(size))
+                row.append('%13s' % ('-' if seconds is None
+                                     else '%.3f' % (seconds * 1e6)))
+            print('%-20s %8d ' % (op, size) + ' '.join(row))
+
+
+def compare_to_baseline(report, baseline, tolerance, slack=2e-8):
+    """
+    Finds the timings that got slower than the baseline by more than tolerance
+
+    Args:
+        report: The dictionary returned by run_suite
+        baseline: A dictionary in the same form, from an earlier run
+        tolerance: The allowed slow down, 0.5 lets a timing be 50% slower
+        slack: Seconds a timing may always grow by, so the timer noise in the
+        calls that take a few tens of nanoseconds isn't flagged
+
+    Returns:
+        A python list of (structure, op, size, baseline, current) tuples
+    """
+    regressions = []
+    for structure, ops in report['results'].items():
+        for op, timings in ops.items():
+            for size, seconds in timings.items():
+                before = baseline['results'].get(structure, {}) \
+                    .get(op, {}).get(size)
+                if before is not None and \
+                        seconds > before * (1 + tolerance) + slack:
+                    regressions.append((structure, op, size, before, seconds))
+    return regressions
+
+
+def _run_elsewhere(sizes, structures, operations):
+    """
+    Runs the suite in a fresh python process. Some timings, the allocating
+    operations most of all, differ by up to half between processes on the
+    same machine, so one process alone can't be trusted to speak for them.
+
+    Args:
+        sizes: The structure sizes to time at
+        structures: The structures to time
+        operations: The operations to time
+
+    Returns:
+        The dictionary run_suite returned in the other process
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'suite.json')
+        subprocess.run([sys.executable, os.path.abspath(__file__), 'suite',
+                        '--sizes'] + [str(size) for size in sizes] +
+                       ['--structures'] + list(structures) +
+                       ['--operations'] + list(operations) +
+                       ['--runs', '1', '--json', path],
+                       check=True, stdout=subprocess.DEVNULL)
+        with open(path) as fp:
+            return json.load(fp)
+
+
+def _median_report(reports):
+    """
+    Combines several runs of the suite into one holding the median of each
+    timing
+
+    Args:
+        reports: The dictionaries returned by run_suite
+
+    Returns:
+        A dictionary in the same form
+    """
+    combined = {'meta': reports[0]['meta'], 'results': {}}
+    for structure, ops in reports[0]['results'].items():
+        for op, timings in ops.items():
+            for size in timings:
+                seconds = statistics.median(
+                    [report['results'][structure][op][size]
+                     for report in reports])
+                combined['results'].setdefault(structure, {}) \
+                    .setdefault(op, {})[size] = seconds
+    return combined
+
+
+def bench_suite(argv=()):
+    """
+    Runs the operation suite from the command line
+
+    Args:
+        argv: The command line options after the benchmark names
+
+    Returns:
+        The exit code, 1 if any timing regressed against the baseline
+    """
+    parser = argparse.ArgumentParser(prog='benchmarks.py suite')
+    parser.add_argument('--sizes', type=int, nargs='+', default=SUITE_SIZES)
+    parser.add_argument('--structures', nargs='+', default=SUITE_STRUCTURES)
+    parser.add_argument('--operations', nargs='+', default=SUITE_OPERATIONS)
+    parser.add_argument('--runs', type=int, default=3,
+                        help='take the median of this many runs, each after '
+                             'the first in a fresh process')
+    parser.add_argument('--json', help='write the results to this file')
+    parser.add_argument('--baseline', help='compare against this file')
+    parser.add_argument('--update', action='store_true',
+                        help='write the results over the baseline instead')
+    parser.add_argument('--tolerance', type=float, default=0.5,
+                        help='allowed slow down before flagging (0.5 = 50%%)')
+    parser.add_argument('--slack', type=float, default=2e-8,
+                        help='seconds any timing may grow by before flagging')
+    options = parser.parse_args(argv)
+
+    reports = [run_suite(sizes=options.sizes, structures=options.structures,
+                         operations=options.operations)]
+    for number in range(options.runs - 1):
+        reports.append(_run_elsewhere(options.sizes, options.structures,
+                                      options.operations))
+    report = _median_report(reports)
+    print_suite(report)
+
+    if options.json:
+        with open(options.json, 'w') as fp:
+            json.dump(report, fp, indent=2, sort_keys=True)
+
+    if options.baseline is None:
+        return 0
+
+    if options.update:
+        with open(options.baseline, 'w') as fp:
+            json.dump(report, fp, indent=2, sort_keys=True)
+        return 0
+
+    with open(options.baseline) as fp:
+        baseline = json.load(fp)
+    regressions = compare_to_baseline(report, baseline, options.tolerance,
+                                      options.slack)
+
+    # the flagged timings are taken twice more, each in a fresh process, and
+    # the median of the three is compared, the same statistic the baseline
+    # holds
+    for structure, op, size, before, seconds in regressions:
+        timings = [seconds]
+        for number in range(2):
+            retimed = _run_elsewhere((int(size),), (structure,), (op,))
+            timings.append(retimed['results'][structure][op][size])
+        report['results'][structure][op][size] = statistics.median(timings)
+    if regressions:
+        regressions = compare_to_baseline(report, baseline, options.tolerance,
+                                          options.slack)
+    for structure, op, size, before, seconds in regressions:
+        print('REGRESSION %s.%s n=%s: %.3fus -> %.3fus'
+              % (structure, op, size, before * 1e6, seconds * 1e6))
+    if not regressions:
+        print('no regressions against %s' % options.baseline)
+    return 1 if regressions else 0
+
+
+BENCHMARKS = {
+    'suite': bench_suite,
+    'memory': bench_memory,
+    'threads': bench_concurrent,
+    'persist': bench_persistent,
+    'snapshot': bench_snapshot,
+    'sort': bench_sort,
+    'versions': bench_versions,
+    'numeric': bench_numeric,
+}
+
+
+if __name__ == '__main__':
+    # benchmark names come first, anything after them goes to the suite
+    args = sys.argv[1:]
+    names = []
+    while args and args[0] in BENCHMARKS:
+        names.append(args.pop(0))
+    if not names:
+        names = ['suite']
+
+    status = 0
+    for name in names:
+        if name == 'suite':
+            status = bench_suite(args) or status
+        else:
+            BENCHMARKS[name]()
+    sys.exit(status)
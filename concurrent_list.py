@@ -0,0 +1,339 @@
+# concurrent_list.py
+# ===================================================
+# Thread-safe blocking deque built on CircularList, and a
+# shared stack readers can take snapshots of without a lock
+# ===================================================
+
+import queue
+import threading
+
+from linked_list import CircularList, PersistentLinkedList
+
+
+class ConcurrentCircularList:
+    def __init__(self, start_list=None, capacity=None):
+        """
+        Initializes a deque that can be shared between producer and consumer
+        threads. Each call only holds the lock for the few pointer updates it
+        makes on the underlying CircularList, and threads that need to wait
+        sleep on a condition instead of polling is_empty().
+
+        Args:
+            start_list: The values to populate the deque with (optional)
+            capacity: The most values the deque will hold before adds block
+            (optional, no limit by default)
+        """
+        if capacity is not None and capacity < 1:
+            raise Exception('Capacity must be at least 1')
+
+        self._list = CircularList(start_list)
+        self.capacity = capacity
+
+        # both conditions share the one lock, so a waiting consumer is woken by
+        # exactly the add that made data available and vice versa
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+
+    def __len__(self):
+        """
+        Returns the number of values in the deque
+
+        Returns:
+            The number of elements in the deque
+        """
+        with self._lock:
+            return len(self._list)
+
+    def __str__(self):
+        """
+        Returns a human readable string of the deque content of the form
+        [value1 <-> value2 <-> value3]
+
+        Returns:
+            The string of the human readable deque representation
+        """
+        with self._lock:
+            return str(self._list)
+
+    def _is_full(self):
+        """
+        Checks if an add would go past the capacity, the lock must be held
+
+        Returns:
+            True if the deque is at capacity, False otherwise
+        """
+        return self.capacity is not None and len(self._list) >= self.capacity
+
+    def _wait_for_room(self, block, timeout):
+        """
+        Waits until there is room for one more value, the lock must be held
+
+        Args:
+            block: If False raise straight away instead of waiting
+            timeout: The most seconds to wait, None waits forever
+        """
+        if not self._is_full():
+            return
+        if not block or \
+                not self._not_full.wait_for(
+                    lambda: not self._is_full(), timeout):
+            raise queue.Full
+
+    def _wait_for_data(self, block, timeout):
+        """
+        Waits until there is at least one value, the lock must be held
+
+        Args:
+            block: If False raise straight away instead of waiting
+            timeout: The most seconds to wait, None waits forever
+        """
+        if not self._list.is_empty():
+            return
+        if not block or \
+                not self._not_empty.wait_for(
+                    lambda: not self._list.is_empty(), timeout):
+            raise queue.Empty
+
+    def add_front(self, data, block=True, timeout=None):
+        """
+        Adds a value at the beginning of the deque, waiting for room if the
+        deque is at capacity
+
+        Args:
+            data: The value to add
+            block: If False raise queue.Full instead of waiting
+            timeout: The most seconds to wait before raising queue.Full
+        """
+        with self._lock:
+            self._wait_for_room(block, timeout)
+            self._list.add_front(data)
+            self._not_empty.notify()
+
+    def add_back(self, data, block=True, timeout=None):
+        """
+        Adds a value at the end of the deque, waiting for room if the deque is
+        at capacity
+
+        Args:
+            data: The value to add
+            block: If False raise queue.Full instead of waiting
+            timeout: The most seconds to wait before raising queue.Full
+        """
+        with self._lock:
+            self._wait_for_room(block, timeout)
+            self._list.add_back(data)
+            self._not_empty.notify()
+
+    def pop_front(self, block=True, timeout=None):
+        """
+        Removes and returns the value at the front of the deque, waiting for
+        one to arrive if the deque is empty
+
+        Args:
+            block: If False raise queue.Empty instead of waiting
+            timeout: The most seconds to wait before raising queue.Empty
+
+        Returns:
+            The value that was at the front of the deque
+        """
+        with self._lock:
+            self._wait_for_data(block, timeout)
+            data = self._list.get_front()
+            self._list.remove_front()
+            self._not_full.notify()
+            return data
+
+    def pop_back(self, block=True, timeout=None):
+        """
+        Removes and returns the value at the end of the deque, waiting for one
+        to arrive if the deque is empty
+
+        Args:
+            block: If False raise queue.Empty instead of waiting
+            timeout: The most seconds to wait before raising queue.Empty
+
+        Returns:
+            The value that was at the end of the deque
+        """
+        with self._lock:
+            self._wait_for_data(block, timeout)
+            data = self._list.get_back()
+            self._list.remove_back()
+            self._not_full.notify()
+            return data
+
+    def get_front(self):
+        """
+        Returns the value at the front of the deque without removing it. Will
+        return None in an empty deque.
+
+        Returns:
+            The value at index 0 or None if there is no such value
+        """
+        with self._lock:
+            return self._list.get_front()
+
+    def get_back(self):
+        """
+        Returns the value at the end of the deque without removing it. Will
+        return None in an empty deque.
+
+        Returns:
+            The value at the last index or None if there is no such value
+        """
+        with self._lock:
+            return self._list.get_back()
+
+    def is_empty(self):
+        """
+        Checks if the deque is empty
+
+        Returns:
+            True if the deque has no values, False otherwise
+        """
+        with self._lock:
+            return self._list.is_empty()
+
+    def contains(self, value):
+        """
+        Checks if any value in the deque equals value
+
+        Args:
+            value: The value to look for
+
+        Returns:
+            True if value is in the deque, False otherwise
+        """
+        with self._lock:
+            return self._list.contains(value)
+
+    def remove(self, value):
+        """
+        Removes the first instance of value from the deque
+
+        Args:
+            value: the value to remove
+
+        Returns:
+            True if a value was removed, False otherwise
+        """
+        with self._lock:
+            removed = self._list.remove(value)
+            if removed:
+                self._not_full.notify()
+            return removed
+
+
+class VersionedLinkedList:
+    def __init__(self, start_list=None):
+        """
+        Initializes a stack that writer threads change and reader threads take
+        snapshots of. It holds the current version of a PersistentLinkedList,
+        each change swaps in the next version, and a snapshot is the current
+        version itself: taking one is a single reference read, it never waits
+        on a writer and writers never wait on it.
+
+        Only writers use the lock, so two of them can't both build on the same
+        version and lose one of the changes.
+
+        Args:
+            start_list: The values to populate the stack with (optional)
+        """
+        self._version = PersistentLinkedList(start_list)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        """
+        Returns the number of values in the current version
+
+        Returns:
+            The number of elements in the stack
+        """
+        return len(self._version)
+
+    def __str__(self):
+        """
+        Returns a human readable string of the current version of the form
+        [value1 -> value2 -> value3]
+
+        Returns:
+            The string of the human readable stack representation
+        """
+        return str(self._version)
+
+    def snapshot(self):
+        """
+        Returns the current version, which nothing can change, so a reader can
+        walk it for as long as it likes while writers carry on
+
+        Returns:
+            A PersistentLinkedList
+        """
+        return self._version
+
+    def add_front(self, data):
+        """
+        Adds a value at the beginning of the stack
+
+        Args:
+            data: The value to add
+        """
+        with self._lock:
+            self._version = self._version.add_front(data)
+
+    def pop_front(self):
+        """
+        Removes and returns the value at the front of the stack
+
+        Returns:
+            The value that was at the front, or None if the stack was empty
+        """
+        with self._lock:
+            version = self._version
+            self._version = version.remove_front()
+            return version.get_front()
+
+    def remove_front(self):
+        """
+        Removes the first value of the stack
+
+        Returns:
+            True if a value was removed, False if the stack was empty
+        """
+        with self._lock:
+            if self._version.is_empty():
+                return False
+            self._version = self._version.remove_front()
+            return True
+
+    def get_front(self):
+        """
+        Returns the value at the front of the stack without removing it. Will
+        return None in an empty stack.
+
+        Returns:
+            The value at index 0 or None if there is no such value
+        """
+        return self._version.get_front()
+
+    def is_empty(self):
+        """
+        Checks if the stack is empty
+
+        Returns:
+            True if the stack has no values, False otherwise
+        """
+        return self._version.is_empty()
+
+    def contains(self, value):
+        """
+        Checks if any value in the current version equals value
+
+        Args:
+            value: The value to look for
+
+        Returns:
+            True if value is in the stack, False otherwise
+        """
+        return self._version.contains(value)
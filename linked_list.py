@@ -6,6 +6,526 @@
 # Linked List
 # ===================================================
 
+import itertools
+import operator
+import pickle
+import random
+import struct
+import time
+
+
+def _write_values(fp, values, size, sep, limit, chunk_size=1024):
+    """
+    Writes [value1<sep>value2<sep>value3] to fp a chunk at a time so the whole
+    string never has to be built in memory
+
+    Args:
+        fp: Any object with a write method that takes a string
+        values: An iterator over the values of the list in order
+        size: The number of values in the list
+        sep: The string written between two values
+        limit: The most values to write, the rest are summarised (optional)
+        chunk_size: How many values are joined together for each write
+    """
+    if limit is not None:
+        values = itertools.islice(values, limit)
+
+    fp.write('[')
+    written = 0
+    while True:
+        chunk = [str(data) for data in itertools.islice(values, chunk_size)]
+        if not chunk:
+            break
+        if written:
+            fp.write(sep)
+        fp.write(sep.join(chunk))
+        written += len(chunk)
+
+    # anything past the limit is just counted so truncated output stays short
+    if written < size:
+        if written:
+            fp.write(sep)
+        fp.write('... (%d more)' % (size - written))
+    fp.write(']')
+
+
+# snapshot layout: magic and value count, then chunks of a byte length followed
+# by a pickled python list of values
+_SNAPSHOT_HEADER = struct.Struct('<4sQ')
+_SNAPSHOT_MAGIC = b'LLS1'
+_CHUNK_HEADER = struct.Struct('<I')
+
+
+def _dump_values(fp, values, size, chunk_size=4096):
+    """
+    Writes a flat snapshot of values to fp a chunk at a time, so neither the
+    Node chain nor one big list of values is ever pickled
+
+    Args:
+        fp: Any object with a write method that takes bytes
+        values: An iterator over the values of the list in order
+        size: The number of values in the list
+        chunk_size: How many values are pickled together
+    """
+    fp.write(_SNAPSHOT_HEADER.pack(_SNAPSHOT_MAGIC, size))
+    while True:
+        chunk = list(itertools.islice(values, chunk_size))
+        if not chunk:
+            break
+        blob = pickle.dumps(chunk, pickle.HIGHEST_PROTOCOL)
+        fp.write(_CHUNK_HEADER.pack(len(blob)))
+        fp.write(blob)
+
+
+def _read_exact(fp, count):
+    """
+    Reads exactly count bytes from fp
+
+    Args:
+        fp: Any object with a read method that returns bytes
+        count: The number of bytes to read
+
+    Returns:
+        The bytes read
+    """
+    data = fp.read(count)
+    if len(data) != count:
+        raise Exception('Snapshot is truncated')
+    return data
+
+
+def _load_values(fp):
+    """
+    Reads back a snapshot written by _dump_values a chunk at a time. Like any
+    pickle it must only be loaded from a trusted source.
+
+    Args:
+        fp: Any object with a read method that returns bytes
+
+    Returns:
+        A generator over the values in order
+    """
+    magic, size = _SNAPSHOT_HEADER.unpack(_read_exact(fp,
+                                                      _SNAPSHOT_HEADER.size))
+    if magic != _SNAPSHOT_MAGIC:
+        raise Exception('Not a list snapshot')
+
+    remaining = size
+    while remaining:
+        length, = _CHUNK_HEADER.unpack(_read_exact(fp, _CHUNK_HEADER.size))
+        chunk = pickle.loads(_read_exact(fp, length))
+        if len(chunk) > remaining:
+            raise Exception('Snapshot holds more values than its header says')
+        remaining -= len(chunk)
+        yield from chunk
+
+
+class OpStats:
+    def __init__(self):
+        """
+        Initializes the counters a list keeps for its walking operations
+        (add_link_before, remove_link, contains and remove) once stats are
+        enabled on it. For each operation it counts the calls, the total time
+        and how many Nodes each call walked past, as a histogram with power of
+        two buckets.
+        """
+        self._ops = {}
+
+    def reset(self):
+        """
+        Clears every counter
+        """
+        self._ops = {}
+
+    def measure(self, owner, op, args, steps):
+        """
+        Runs one call of an operation with stats switched off on owner, so the
+        call takes its normal path, and records it
+
+        Args:
+            owner: The list the call is made on
+            op: The name of the method to call
+            args: The arguments to call it with
+            steps: The number of Nodes the call walks past, worked out by the
+            caller before the call since a remove can't be counted after
+
+        Returns:
+            Whatever the method returned
+        """
+        method = getattr(owner, op)
+        owner._stats = None
+        start = time.perf_counter()
+        try:
+            return method(*args)
+        finally:
+            elapsed = time.perf_counter() - start
+            owner._stats = self
+            self.record(op, steps, elapsed)
+
+    def count(self, op, walk, value):
+        """
+        Runs one call of a walk that counts the Nodes it looks at itself, and
+        records it
+
+        Args:
+            op: The name of the operation
+            walk: Called with value, returns a tuple of the result and the
+            number of Nodes looked at
+            value: The value to pass to walk
+
+        Returns:
+            The result walk returned
+        """
+        start = time.perf_counter()
+        result, steps = walk(value)
+        self.record(op, steps, time.perf_counter() - start)
+        return result
+
+    def record(self, op, steps, elapsed):
+        """
+        Adds one call to the counters of op
+
+        Args:
+            op: The name of the operation
+            steps: The number of Nodes the call walked past
+            elapsed: The time the call took in seconds
+        """
+        counters = self._ops.get(op)
+        if counters is None:
+            counters = self._ops[op] = {'calls': 0, 'nodes': 0,
+                                        'seconds': 0.0, 'histogram': {}}
+        counters['calls'] += 1
+        counters['nodes'] += steps
+        counters['seconds'] += elapsed
+
+        # bucket 0 holds calls that walked no Nodes, bucket k holds calls that
+        # walked 2**(k-1) up to 2**k - 1 Nodes
+        bucket = steps.bit_length()
+        histogram = counters['histogram']
+        histogram[bucket] = histogram.get(bucket, 0) + 1
+
+    def snapshot(self):
+        """
+        Returns a copy of the counters, with the histogram buckets labelled by
+        the range of Nodes walked ('0', '1', '2-3', '4-7', ...)
+
+        Returns:
+            A dictionary of operation name -> dictionary of calls, nodes,
+            seconds and histogram
+        """
+        snapshot = {}
+        for op, counters in self._ops.items():
+            histogram = {}
+            for bucket in sorted(counters['histogram']):
+                if bucket <= 1:
+                    label = str(bucket)
+                else:
+                    label = '%d-%d' % (2 ** (bucket - 1), 2 ** bucket - 1)
+                histogram[label] = counters['histogram'][bucket]
+
+            snapshot[op] = {
+                'calls': counters['calls'],
+                'nodes': counters['nodes'],
+                'seconds': counters['seconds'],
+                'histogram': histogram,
+            }
+        return snapshot
+
+
+def _merge_runs(left, right, keys, reverse, dummy):
+    """
+    Merges two sorted runs of Nodes, chained through next and ending in None,
+    into one sorted run. Equal values keep left before right so the sort is
+    stable. The merged run is left on dummy.next even if a comparison raises.
+
+    Args:
+        left: The first Node of the run that came first in the list
+        right: The first Node of the run that came after it
+        keys: A dictionary of Node -> sort key, or None to compare the data
+        reverse: If True the run is sorted largest first
+        dummy: A spare Node used as the head of the merged run
+
+    Returns:
+        The first Node of the merged run
+    """
+    tail = dummy
+    tail.next = None
+    try:
+        while left is not None and right is not None:
+            if keys is None:
+                left_key, right_key = left.data, right.data
+            else:
+                left_key, right_key = keys[left], keys[right]
+
+            # only a strictly better right Node goes first, so ties stay in
+            # their original order either way round
+            if left_key < right_key if reverse else right_key < left_key:
+                tail.next = right
+                tail = right
+                right = right.next
+            else:
+                tail.next = left
+                tail = left
+                left = left.next
+    finally:
+        # whatever is left of the runs goes on the end. Normally one of them is
+        # used up, after a failed comparison both are chained on so no Node is
+        # lost.
+        if left is None:
+            tail.next = right
+        else:
+            tail.next = left
+            if right is not None:
+                while tail.next is not None:
+                    tail = tail.next
+                tail.next = right
+
+    merged = dummy.next
+    dummy.next = None
+    return merged
+
+
+def _merge_sort_chain(first, count, keys, reverse, dummy):
+    """
+    Sorts count Nodes chained through next, starting at first, by merging runs
+    bottom up: runs of 1 into runs of 2, runs of 2 into runs of 4 and so on,
+    keeping at most one run of each size waiting. Only the next fields change.
+
+    If a comparison raises, every Node is chained back together (in no
+    particular order) from dummy.next before the exception is passed on.
+
+    Args:
+        first: The first Node to sort
+        count: The number of Nodes to sort
+        keys: A dictionary of Node -> sort key, or None to compare the data
+        reverse: If True the Nodes are sorted largest first
+        dummy: A spare Node for the merges
+
+    Returns:
+        The first Node of the sorted chain, which ends in None
+    """
+    # runs[i] is a sorted run of 2**i Nodes or None, higher runs hold Nodes
+    # from earlier in the list
+    runs = []
+    cur = first
+    taken = 0  # how many Nodes have been taken off the front of the chain
+    run = None
+    try:
+        while taken < count:
+            run, cur = cur, cur.next
+            taken += 1
+            run.next = None
+            level = 0
+            while level < len(runs) and runs[level] is not None:
+                earlier, runs[level] = runs[level], None
+                later, run = run, None
+                run = _merge_runs(earlier, later, keys, reverse, dummy)
+                level += 1
+            if level == len(runs):
+                runs.append(run)
+            else:
+                runs[level] = run
+            run = None
+
+        # fold the waiting runs together, the smallest holds the latest Nodes
+        for level in range(len(runs)):
+            if runs[level] is None:
+                continue
+            earlier, runs[level] = runs[level], None
+            later, run = run, None
+            if later is None:
+                run = earlier
+            else:
+                run = _merge_runs(earlier, later, keys, reverse, dummy)
+        return run
+    except BaseException:
+        # chain the interrupted merge, the waiting runs and the Nodes not yet
+        # reached into one piece so the caller can put the list back together
+        pieces = [dummy.next, run] + runs
+        if taken < count:
+            pieces.append(cur)
+        tail = dummy
+        seen = 0
+        for piece in pieces:
+            if piece is None:
+                continue
+            tail.next = piece
+            while tail.next is not None and seen < count:
+                tail = tail.next
+                seen += 1
+        tail.next = None
+        raise
+
+
+def _scan_many(items, values, find_all):
+    """
+    Matches every item against all of values in a single pass. Hashable values
+    go in a dictionary so each item costs one lookup however many values there
+    are, unhashable values are compared one by one.
+
+    Args:
+        items: The values of the list in order
+        values: The values to look for, duplicates allowed
+        find_all: True to count every match, False to stop as soon as every
+        value has been found once
+
+    Returns:
+        A tuple of two python lists lined up with values: the number of
+        matches (only complete if find_all) and the index of the first match,
+        or None where there was none
+    """
+    values = list(values)
+
+    # one entry per distinct hashable value, holding its first index and
+    # count, so duplicate values are only looked for once
+    found = {}
+    unhashable = []
+    for value in values:
+        try:
+            found[value] = [None, 0]
+        except TypeError:
+            unhashable.append([value, None, 0])
+
+    missing = len(found) + len(unhashable)
+    for index, data in enumerate(items):
+        try:
+            entry = found.get(data)
+        except TypeError:
+            entry = None
+        if entry is not None:
+            if entry[0] is None:
+                entry[0] = index
+                missing -= 1
+            entry[1] += 1
+
+        for entry in unhashable:
+            if data == entry[0]:
+                if entry[1] is None:
+                    entry[1] = index
+                    missing -= 1
+                entry[2] += 1
+
+        if not missing and not find_all:
+            break
+
+    firsts = []
+    counts = []
+    others = iter(unhashable)
+    for value in values:
+        try:
+            first, count = found[value]
+        except TypeError:
+            value, first, count = next(others)
+        firsts.append(first)
+        counts.append(count)
+    return counts, firsts
+
+
+def _contains_many(items, index, values):
+    """
+    Checks which of values are among items, see LinkedList.contains_many
+
+    Args:
+        items: The values of the list in order
+        index: The value index of the list, or None if it has none
+        values: The values to look for
+
+    Returns:
+        A python list of True or False for each of values, in order
+    """
+    values = list(values)
+
+    # with a value index every hashable value is a dictionary lookup
+    if index is not None:
+        try:
+            return [value in index for value in values]
+        except TypeError:
+            pass
+
+    counts, firsts = _scan_many(items, values, False)
+    return [first is not None for first in firsts]
+
+
+def _count_many(items, index, values):
+    """
+    Counts how many times each of values is among items, see
+    LinkedList.count_many
+
+    Args:
+        items: The values of the list in order
+        index: The value index of the list, or None if it has none
+        values: The values to count
+
+    Returns:
+        A python list of the count of each of values, in order
+    """
+    values = list(values)
+
+    # with a value index the count is the number of indexed Nodes
+    if index is not None:
+        try:
+            return [len(index.get(value, ())) for value in values]
+        except TypeError:
+            pass
+
+    counts, firsts = _scan_many(items, values, True)
+    return counts
+
+
+def _index_add(index, node):
+    """
+    Records node in a value index, which maps each value to the set of Nodes
+    holding it. Nodes holding unhashable data are left out and only ever
+    found by scanning.
+
+    Args:
+        index: The value index of the list
+        node: The Node that was just linked into the list
+    """
+    try:
+        bucket = index.get(node.data)
+    except TypeError:
+        return
+
+    if bucket is None:
+        index[node.data] = {node}
+    else:
+        bucket.add(node)
+
+
+def _index_discard(index, node):
+    """
+    Drops node from a value index
+
+    Args:
+        index: The value index of the list
+        node: The Node that was just unlinked from the list
+    """
+    try:
+        bucket = index.get(node.data)
+    except TypeError:
+        return
+
+    bucket.discard(node)
+    if not bucket:
+        del index[node.data]
+
+
+def _index_chain(index, first, count):
+    """
+    Records a chain of count Nodes, following next from first, in a value
+    index
+
+    Args:
+        index: The value index of the list
+        first: The first Node of the chain
+        count: The number of Nodes in the chain
+    """
+    node = first
+    for number in range(count):
+        _index_add(index, node)
+        node = node.next
+
 
 """
 *******************************************************************************
@@ -15,24 +535,42 @@ Part1: Deque and Bag implemented with Linked List
 
 
 class SLNode:
+    # slots keep each Node down to its two fields instead of a whole __dict__
+    __slots__ = ('next', 'data')
+
     def __init__(self):
         self.next = None
         self.data = None
 
 
 class LinkedList:
-    def __init__(self, start_list=None):
+    def __init__(self, start_list=None, index_values=False):
         """
         Initializes a linked list with a head and tail node with None data
+
+        Args:
+            start_list: The values to populate the list with (optional)
+            index_values: If True the list keeps a map from each hashable value
+            to the Nodes holding it, which makes contains O(1)
         """
         self.head = SLNode()
         self.tail = SLNode()
         self.head.next = self.tail
 
+        # we keep track of the last data Node (the head when the list is empty)
+        # and the number of data Nodes so the back of the list and the size
+        # never need a walk.
+        self._last = self.head
+        self._size = 0
+        self._modcount = 0  # bumped on every change, for iterators
+
+        # value -> set of Nodes holding that value, None when not indexing
+        self._index = {} if index_values else None
+        self._stats = None  # an OpStats once enable_stats is called
+
         # populate list with initial set of nodes (if provided)
         if start_list is not None:
-            for data in start_list:
-                self.add_back(data)
+            self.extend_back(start_list)
 
     def __str__(self):
         """
@@ -44,65 +582,340 @@ class LinkedList:
         Returns:
             The string of the human readable list representation
         """
-        out = '['
-        if self.head.next != self.tail:
-            cur = self.head.next.next
-            out = out + str(self.head.next.data)
-            while cur != self.tail:
-                out = out + ' -> ' + str(cur.data)
-                cur = cur.next
-        out = out + ']'
-        return out
+        return '[' + ' -> '.join([str(data) for data in self]) + ']'
 
-    def add_link_before(self, data, index):
+    def __len__(self):
         """
-        Adds a new link containing data and inserts it before the link at index.
-        If index is 0, it inserts at the beginning of the list.
+        Returns the number of data nodes in the list
+
+        Returns:
+            The number of elements in the list
+        """
+        return self._size
+
+    def __iter__(self):
+        """
+        Walks the list from front to back. Changing the list while the walk is
+        going on raises an exception on the next step.
+
+        Returns:
+            A generator over the data of each data Node
+        """
+        return self._walk(self._modcount)
+
+    def _walk(self, modcount):
+        """
+        Walks every data Node from front to back. The modcount is taken when
+        the walk is asked for, so a change before the first step is caught too.
 
         Args:
-            data: The data the new node will contain
-            index: The index of the node that will immediately follow the newly
-            added node
+            modcount: The modcount the list must keep for the walk to go on
+
+        Returns:
+            A generator over the data of each data Node
+        """
+        if self._modcount != modcount:
+            raise Exception('List modified during iteration')
+        cur = self.head.next
+        while cur is not self.tail:
+            yield cur.data
+            if self._modcount != modcount:
+                raise Exception('List modified during iteration')
+            cur = cur.next
+
+    def __reversed__(self):
+        """
+        Walks the list from back to front. A singly linked list can't step
+        backwards, so the data is copied out first and the copy is walked.
+
+        Returns:
+            An iterator over the data of each data Node
+        """
+        return reversed(list(self))
+
+    def _node_at(self, index):
+        """
+        Walks to the data Node at index
+
+        Args:
+            index: The index of the node, must be in range
+
+        Returns:
+            The Node at index
+        """
+
+        # the last Node is always at hand
+        if index == self._size - 1:
+            return self._last
+
+        cur = self.head.next
+        for number in range(index):
+            cur = cur.next
+        return cur
+
+    def __getitem__(self, index):
+        """
+        Returns the data at index, negative indexes count back from the end.
+        A slice returns a new list of the same kind holding those values.
+
+        Args:
+            index: An int or a slice
+
+        Returns:
+            The data at index, or a new list for a slice
         """
+        if isinstance(index, slice):
+            return self.from_iterable(
+                self.islice(index.start, index.stop, index.step),
+                index_values=self._index is not None)
 
-        # if the index is less than 0 raise range exception
         if index < 0:
+            index += self._size
+        if index < 0 or index >= self._size:
             raise Exception('Index out of range')
 
-        new_link = SLNode()  # initialize a new link
-        new_link.data = data  # set new_link data
+        return self._node_at(index).data
 
-        # if the list is empty the node is placed at the beginning
-        if self.head.next == self.tail:
-            new_link.next = self.tail
-            self.head.next = new_link
+    def islice(self, start=None, stop=None, step=None):
+        """
+        Lazily walks the values picked out by start, stop and step, which work
+        the same as a python slice. A negative step has to copy the data out
+        first since a singly linked list can't step backwards.
+
+        Args:
+            start: The first index (optional)
+            stop: The index to stop before (optional)
+            step: How many indexes to move each time (optional)
+
+        Returns:
+            A generator over the selected data
+        """
+        positions = range(*slice(start, stop, step).indices(self._size))
+        return self._walk_positions(positions, self._modcount)
+
+    def _walk_positions(self, positions, modcount):
+        """
+        Walks the data at each of positions, see islice. The positions and
+        modcount are taken when the walk is asked for, so a change before the
+        first step is caught too.
+
+        Args:
+            positions: The range of indexes to walk
+            modcount: The modcount the list must keep for the walk to go on
+
+        Returns:
+            A generator over the selected data
+        """
+        if self._modcount != modcount:
+            raise Exception('List modified during iteration')
+        if not positions:
             return
 
-        # if the index is 0 the new Node is placed at the start of the list.
-        if index == 0:
-            new_link.next = self.head.next
-            self.head.next = new_link
+        if positions.step < 0:
+            values = list(self)
+            for index in positions:
+                yield values[index]
+                if self._modcount != modcount:
+                    raise Exception('List modified during iteration')
             return
 
-        # inserts the node at the specified index
-        cur = self.head
-        prev = None
+        cur = self._node_at(positions[0])
+        remaining = len(positions)
+        while True:
+            yield cur.data
+            remaining -= 1
+            if remaining == 0:
+                return
+            if self._modcount != modcount:
+                raise Exception('List modified during iteration')
+            for number in range(positions.step):
+                cur = cur.next
+
+    def write_to(self, fp, sep=' -> ', limit=None):
+        """
+        Writes the same text as __str__ to fp in chunks instead of building it
+        as one string
+
+        Args:
+            fp: Any file-like object with a write method
+            sep: The string written between two values
+            limit: The most values to write, the rest are summarised as
+            '... (n more)' (optional)
+        """
+        _write_values(fp, iter(self), self._size, sep, limit)
 
-        # moving through the list
-        for number in range(index + 1):
+    def dump(self, fp):
+        """
+        Writes a compact snapshot of the values to fp, see load. The values
+        are pickled a chunk at a time, never the Nodes themselves.
 
-            # if the current Node ever becomes the tail sentinel we raise
-            # an index exception.
-            if cur == self.tail:
-                raise Exception('Index out of bounds')
+        Args:
+            fp: A file opened for writing bytes
+        """
+        _dump_values(fp, iter(self), self._size)
 
-            prev = cur
-            cur = cur.next
+    @classmethod
+    def load(cls, fp, index_values=False):
+        """
+        Builds a new list from a snapshot written by dump, linking the Nodes
+        in as each chunk is read
+
+        Args:
+            fp: A file opened for reading bytes
+            index_values: If True the new list keeps a value index
+
+        Returns:
+            The newly built list
+        """
+        return cls.from_iterable(_load_values(fp), index_values=index_values)
+
+    def __reduce__(self):
+        """
+        Pickles the list as its values in a flat python list instead of a
+        chain of Nodes, which would recurse once per Node.
+
+        Returns:
+            The class and the constructor arguments that rebuild the list
+        """
+        return self.__class__, (list(self), self._index is not None)
+
+    # ----- instrumentation -----
+
+    def enable_stats(self):
+        """
+        Starts counting calls, Nodes walked and time spent in add_link_before,
+        remove_link, contains and remove. Until this is called those methods
+        only pay for one check that stats are off.
+        """
+        if self._stats is None:
+            self._stats = OpStats()
+
+    def disable_stats(self):
+        """
+        Stops counting and throws the counters away
+        """
+        self._stats = None
+
+    def reset_stats(self):
+        """
+        Zeroes the counters without turning stats off
+        """
+        if self._stats is not None:
+            self._stats.reset()
+
+    def stats(self):
+        """
+        Returns a snapshot of the counters, see OpStats.snapshot
+
+        Returns:
+            A dictionary of operation name -> counters, empty if stats are off
+        """
+        if self._stats is None:
+            return {}
+        return self._stats.snapshot()
+
+    def _walk_length(self, op, index):
+        """
+        Works out how many Nodes add_link_before or remove_link is about to
+        walk past, which only depends on the index
+
+        Args:
+            op: The name of the operation
+            index: The index the operation was called with
+
+        Returns:
+            The number of Nodes the call will walk past
+        """
+        # adding at the very end goes straight to the last Node
+        if op == 'add_link_before' and index == self._size:
+            return 0
+        return max(0, min(index, self._size))
+
+    def _link_after(self, prev, data):
+        """
+        Links a new Node holding data in directly after prev. Every insert goes
+        through here so _last, the size and the value index stay in step.
+
+        Args:
+            prev: The Node the new Node will follow, the head or a data Node
+            data: The data the new node will contain
+
+        Returns:
+            The newly linked Node
+        """
+        new_link = SLNode()  # initialize a new link
+        new_link.data = data  # set new_link data
+        new_link.next = prev.next
+        prev.next = new_link
+
+        # a Node added after the last one becomes the new last
+        if prev is self._last:
+            self._last = new_link
+        self._size += 1
+        self._modcount += 1
+
+        if self._index is not None:
+            _index_add(self._index, new_link)
+        return new_link
+
+    def _unlink_after(self, prev):
+        """
+        Unlinks the Node directly after prev. Every removal goes through here
+        so _last, the size and the value index stay in step.
+
+        Args:
+            prev: The Node before the one to remove
+        """
+
+        # I don't delete my own Nodes, I have people for that, or... python.
+        cur = prev.next
+        prev.next = cur.next
+
+        # if we took off the last Node the one before it is the new last
+        if cur is self._last:
+            self._last = prev
+        self._size -= 1
+        self._modcount += 1
+
+        if self._index is not None:
+            _index_discard(self._index, cur)
+
+    def add_link_before(self, data, index):
+        """
+        Adds a new link containing data and inserts it before the link at index.
+        If index is 0, it inserts at the beginning of the list.
+
+        Args:
+            data: The data the new node will contain
+            index: The index of the node that will immediately follow the newly
+            added node
+        """
+
+        # stats are off unless enable_stats was called, so this is the only
+        # cost they add to a call
+        if self._stats is not None:
+            steps = self._walk_length('add_link_before', index)
+            return self._stats.measure(self, 'add_link_before', (data, index),
+                                       steps)
+
+        # if the index is outside of the list raise range exception, an index
+        # equal to the size places the node at the end of the list.
+        if index < 0 or index > self._size:
+            raise Exception('Index out of range')
+
+        # inserting at the end doesn't need a walk
+        if index == self._size:
+            self._link_after(self._last, data)
+            return
+
+        # moving through the list to the Node just before our index
+        prev = self.head
+        for number in range(index):
+            prev = prev.next
 
         # the for loop has targeted the correct index, we can now insert the
         # node into the list.
-        new_link.next = cur
-        prev.next = new_link
+        self._link_after(prev, data)
 
         return
 
@@ -113,26 +926,20 @@ class LinkedList:
             index: The index of the node that will be removed
         """
 
-        # if the index is less than 0 raise range exception
-        if index < 0:
-            raise Exception('Index out of range')
+        if self._stats is not None:
+            return self._stats.measure(self, 'remove_link', (index,),
+                                       self._walk_length('remove_link', index))
 
-        cur = self.head
-        prev = None
+        # if the index is outside of the list raise range exception
+        if index < 0 or index >= self._size:
+            raise Exception('Index out of range')
 
-        if index == 0:
-            self.head.next = cur.next
-
-        # go through the linked list until we find the specified index
-        for number in range(index + 1):
-            # if cur ever becomes the tail sentinel we raise a range exception
-            if cur == self.tail:
-                raise Exception('Index out of range')
-            prev = cur
-            cur = cur.next
+        # go through the linked list until we find the Node before our index
+        prev = self.head
+        for number in range(index):
+            prev = prev.next
 
-        # I don't delete my own Nodes, I have people for that, or... python.
-        prev.next = cur.next
+        self._unlink_after(prev)
 
     def add_front(self, data):
         """
@@ -141,10 +948,7 @@ class LinkedList:
         Args:
             data: The data the new node will contain
         """
-        new_link = SLNode()  # initialize a new link
-        new_link.data = data  # set new_link data
-        new_link.next = self.head.next  # set new_link next to the next Node
-        self.head.next = new_link  # set the front sentinel to point to new_link
+        self._link_after(self.head, data)
 
     def add_back(self, data):
         """
@@ -153,20 +957,2860 @@ class LinkedList:
         Args:
             data: The data the new node will contain
         """
-        new_link = SLNode()  # initialize a new link
-        new_link.data = data  # set new_link data
-        cur = self.head
-        prev = None
 
-        # since it's single link we need to go through the list to find the end
-        # not the most efficient. O(n)?
-        while cur != self.tail:
-            prev = cur
-            cur = cur.next
+        # we know where the end of the list is so we link in straight after
+        # the last Node. O(1)
+        self._link_after(self._last, data)
 
-        # once we've found the end of the list we insert our new_link
-        new_link.next = cur
-        prev.next = new_link
+    @classmethod
+    def from_iterable(cls, iterable, index_values=False):
+        """
+        Builds a new list holding the values of iterable in order
+
+        Args:
+            iterable: The values the new list will contain
+            index_values: If True the new list keeps a value index
+
+        Returns:
+            The newly built list
+        """
+        new_list = cls(index_values=index_values)
+        new_list.extend_back(iterable)
+        return new_list
+
+    def _build_chain(self, iterable):
+        """
+        Links the values of iterable into a chain of Nodes that is not yet
+        attached to the list
+
+        Args:
+            iterable: The values the chain will contain
+
+        Returns:
+            A tuple of the first Node, the last Node and the number of Nodes,
+            the Nodes are None if iterable was empty
+        """
+        first = None
+        last = None
+        count = 0
+
+        for data in iterable:
+            new_link = SLNode()  # initialize a new link
+            new_link.data = data  # set new_link data
+
+            if last is None:
+                first = new_link
+            else:
+                last.next = new_link
+            last = new_link
+            count += 1
+
+        return first, last, count
+
+    def extend_back(self, iterable):
+        """
+        Adds the values of iterable to the end of the list in order
+
+        Args:
+            iterable: The values the new nodes will contain
+        """
+        first, last, count = self._build_chain(iterable)
+        if count == 0:
+            return
+
+        # the whole chain goes in with a single pointer update after _last
+        last.next = self.tail
+        self._last.next = first
+        self._last = last
+        self._size += count
+        self._modcount += 1
+
+        # the values are only indexed once they are really in the list, so a
+        # failing iterable leaves nothing behind in the index
+        if self._index is not None:
+            _index_chain(self._index, first, count)
+
+    def extend_front(self, iterable):
+        """
+        Adds the values of iterable to the beginning of the list, keeping their
+        order, so the first value of iterable becomes the front of the list
+
+        Args:
+            iterable: The values the new nodes will contain
+        """
+        first, last, count = self._build_chain(iterable)
+        if count == 0:
+            return
+
+        # the whole chain goes in with a single pointer update after the head
+        last.next = self.head.next
+        self.head.next = first
+
+        # if the list was empty the end of the chain is now the last Node
+        if self._last is self.head:
+            self._last = last
+        self._size += count
+        self._modcount += 1
+
+        # the values are only indexed once they are really in the list, so a
+        # failing iterable leaves nothing behind in the index
+        if self._index is not None:
+            _index_chain(self._index, first, count)
+
+    def get_front(self):
+        """
+        Returns the data in the element at the front of the list. Will return
+        None in an empty list.
+
+        Returns:
+            The data in the node at index 0 or None if there is no such node
+        """
+
+        # if the list is empty return None
+        if self.head.next == self.tail:
+            return None
+
+        # otherwise we return the data of the first Node.
+        return self.head.next.data
+
+    def get_back(self):
+        """
+        Returns the data in the element at the end of the list. Will return
+        None in an empty list.
+
+        Returns:
+            The data in the node at last index of the list or None if there is
+            no such node
+        """
+
+        # if the list is empty returns None.
+        if self._size == 0:
+            return None
+
+        return self._last.data
+
+    def remove_front(self):
+        """
+        Removes the first element of the list. Will not remove the tail.
+        """
+
+        # if the list is empty nothing happens.
+        if self.head.next == self.tail:
+            return False
+
+        # change the next data members to point to skip the first Node
+        self._unlink_after(self.head)
+        return True
+
+    def remove_back(self):
+        """
+        Removes the last element of the list. Will not remove the head.
+        """
+
+        # if the list is empty nothing happens.
+        if self._size == 0:
+            return False
+
+        # since it's single link we still need to find the Node before the last
+        # one, but the size tells us exactly how far to go so we don't have to
+        # compare against the tail on the way.
+        prev = self.head
+        for number in range(self._size - 1):
+            prev = prev.next
+
+        self._unlink_after(prev)
+        return True
+
+    def sort(self, key=None, reverse=False):
+        """
+        Sorts the list in place with a stable bottom up merge sort that only
+        relinks the existing Nodes, nothing is copied or allocated per value.
+        If a comparison raises, the list keeps all of its values but in no
+        particular order.
+
+        Args:
+            key: Called once on each value to get what to sort by (optional)
+            reverse: If True the list is sorted largest first
+        """
+        if self._size < 2:
+            return
+
+        # like sorted() each key is worked out once, not once per comparison
+        keys = None
+        if key is not None:
+            keys = {}
+            cur = self.head.next
+            while cur != self.tail:
+                keys[cur] = key(cur.data)
+                cur = cur.next
+
+        dummy = SLNode()
+        first = None
+        try:
+            first = _merge_sort_chain(self.head.next, self._size, keys,
+                                      reverse, dummy)
+        except BaseException:
+            first = dummy.next
+            raise
+        finally:
+            # find the new last Node and hook the tail back on
+            self.head.next = first
+            last = self.head
+            for number in range(self._size):
+                last = last.next
+            last.next = self.tail
+            self._last = last
+            self._modcount += 1
+
+    def insert_sorted(self, data, key=None, reverse=False):
+        """
+        Adds data after every value that sorts before or equal to it, so a list
+        that was sorted with the same key and reverse stays sorted. Equal
+        values keep the order they were inserted in.
+
+        Args:
+            data: The data the new node will contain
+            key: Called on each value to get what to sort by (optional)
+            reverse: If True the list is kept largest first
+
+        Returns:
+            The index the new node was inserted at
+        """
+        new_key = data if key is None else key(data)
+
+        def goes_before(node):
+            node_key = node.data if key is None else key(node.data)
+            return node_key < new_key if reverse else new_key < node_key
+
+        # values often arrive roughly in order, and the back needs no walk
+        if self._size == 0 or not goes_before(self._last):
+            self._link_after(self._last, data)
+            return self._size - 1
+
+        prev = self.head
+        index = 0
+        while not goes_before(prev.next):
+            prev = prev.next
+            index += 1
+
+        self._link_after(prev, data)
+        return index
+
+    def is_empty(self):
+        """
+        Checks if the list is empty
+
+        Returns:
+            True if the list has no data nodes, False otherwise
+        """
+
+        # returns true if the list is empty
+        return self._size == 0
+
+    def contains(self, value):
+        """
+        Checks if any node contains value
+
+        Args:
+            value: The value to look for
+
+        Returns:
+            True if value is in the list, False otherwise
+        """
+
+        if self._stats is not None:
+            return self._stats.count('contains', self._contains, value)
+        return self._contains(value)[0]
+
+    def _contains(self, value):
+        """
+        The walk behind contains, counting the Nodes it looks at
+
+        Args:
+            value: The value to look for
+
+        Returns:
+            A tuple of True or False and the number of Nodes looked at
+        """
+
+        # with a value index a hashable value is a single dictionary lookup
+        if self._index is not None:
+            try:
+                return value in self._index, 0
+            except TypeError:
+                pass
+
+        prev, steps = self._find_after(value, None)
+        return prev is not None, steps
+
+    def _find_after(self, value, bucket):
+        """
+        Walks to the first Node holding value, or to the first of the Nodes in
+        bucket when one is given. Counting the steps with a range over the size
+        costs no more than checking for the tail, so every walk counts.
+
+        Args:
+            value: The value to look for
+            bucket: A set of the Nodes holding value, from the value index
+            (optional)
+
+        Returns:
+            A tuple of the Node in front of the one found, None if there is no
+            such Node, and the number of Nodes looked at
+        """
+        prev = self.head
+        cur = self.head.next
+
+        # sort through the list checking each Node, if found return the Node
+        # before it since that's what unlinking needs
+        if bucket is not None:
+            for steps in range(1, self._size + 1):
+                if cur in bucket:
+                    return prev, steps
+                prev = cur
+                cur = cur.next
+        else:
+            for steps in range(1, self._size + 1):
+                if cur.data == value:
+                    return prev, steps
+                prev = cur
+                cur = cur.next
+        return None, self._size
+
+    def contains_many(self, values):
+        """
+        Checks which of values are in the list with a single walk, instead of
+        one walk per value
+
+        Args:
+            values: The values to look for
+
+        Returns:
+            A python list of True or False for each of values, in order
+        """
+        return _contains_many(self, self._index, values)
+
+    def count_many(self, values):
+        """
+        Counts how many times each of values is in the list with a single walk
+
+        Args:
+            values: The values to count
+
+        Returns:
+            A python list of the count of each of values, in order
+        """
+        return _count_many(self, self._index, values)
+
+    def index_many(self, values):
+        """
+        Finds the index of the first instance of each of values with a single
+        walk, which stops once all of them have been found
+
+        Args:
+            values: The values to look for
+
+        Returns:
+            A python list of the index of each of values, or None where a
+            value isn't in the list, in order
+        """
+        counts, firsts = _scan_many(self, values, False)
+        return firsts
+
+    def index_of(self, value):
+        """
+        Finds the index of the first instance of value
+
+        Args:
+            value: The value to look for
+
+        Returns:
+            The index of value, or None if it isn't in the list
+        """
+        return self.index_many([value])[0]
+
+    def remove(self, value):
+        """
+        Removes the first instance of an element from the list
+
+        Args:
+            value: the value to remove
+        """
+
+        if self._stats is not None:
+            return self._stats.count('remove', self._remove, value)
+        return self._remove(value)[0]
+
+    def _remove(self, value):
+        """
+        The walk behind remove, counting the Nodes it looks at
+
+        Args:
+            value: the value to remove
+
+        Returns:
+            A tuple of None and the number of Nodes looked at
+        """
+
+        # with a value index we know straight away if there is nothing to
+        # remove, otherwise we only have to walk until we reach one of the
+        # indexed Nodes since we still need the Node in front of it.
+        bucket = None
+        if self._index is not None:
+            try:
+                bucket = self._index.get(value)
+            except TypeError:
+                pass
+            else:
+                if bucket is None:
+                    return None, 0
+
+        prev, steps = self._find_after(value, bucket)
+        if prev is not None:
+            # we change prev.next to point to skip the Node holding the value
+            self._unlink_after(prev)
+        return None, steps
+
+    def _remove_where(self, match, on_remove):
+        """
+        Unlinks every Node whose data match returns True for, in one walk. The
+        survivors keep their order.
+
+        Args:
+            match: Called with each value, True means remove it
+            on_remove: Called with each removed value once the walk is over,
+            so it is free to change the list (optional)
+
+        Returns:
+            The number of values removed
+        """
+        count = 0
+        removed = [] if on_remove is not None else None
+        prev = self.head
+        cur = self.head.next
+        try:
+            while cur != self.tail:
+                following = cur.next
+                if match(cur.data):
+                    if removed is not None:
+                        removed.append(cur.data)
+                    count += 1
+                    self._unlink_after(prev)
+                else:
+                    prev = cur
+                cur = following
+        finally:
+            # values already taken out are still reported if match raised
+            if removed is not None:
+                for data in removed:
+                    on_remove(data)
+        return count
+
+    def remove_all(self, value, on_remove=None):
+        """
+        Removes every instance of value from the list in a single walk, unlike
+        calling remove until it fails which starts a new walk each time
+
+        Args:
+            value: The value to remove
+            on_remove: Called with each removed value (optional)
+
+        Returns:
+            The number of values removed
+        """
+
+        # with a value index a missing value needs no walk at all
+        if self._index is not None:
+            try:
+                if value not in self._index:
+                    return 0
+            except TypeError:
+                pass
+
+        return self._remove_where(lambda data: data == value, on_remove)
+
+    def remove_if(self, predicate, on_remove=None):
+        """
+        Removes every value predicate returns True for, in a single walk
+
+        Args:
+            predicate: Called with each value
+            on_remove: Called with each removed value (optional)
+
+        Returns:
+            The number of values removed
+        """
+        return self._remove_where(predicate, on_remove)
+
+    def retain(self, predicate, on_remove=None):
+        """
+        Keeps only the values predicate returns True for, removing the rest in
+        a single walk
+
+        Args:
+            predicate: Called with each value
+            on_remove: Called with each removed value (optional)
+
+        Returns:
+            The number of values removed
+        """
+        return self._remove_where(lambda data: not predicate(data), on_remove)
+
+'''
+*******************************************************************************
+Part 2: 9898-465-7436 is the zoom meeting id 
+*******************************************************************************
+'''
+
+
+class DLNode:
+    # slots keep each Node down to its three fields instead of a whole __dict__
+    __slots__ = ('next', 'prev', 'data')
+
+    def __init__(self):
+        self.next = None
+        self.prev = None
+        self.data = None
+
+
+class CircularList:
+    def __init__(self, start_list=None, index_values=False, maxlen=None,
+                 on_evict=None):
+        """
+        Initializes a linked list with a single sentinel node containing None
+        data
+
+        Args:
+            start_list: The values to populate the list with (optional)
+            index_values: If True the list keeps a map from each hashable value
+            to the Nodes holding it, which makes contains O(1)
+            maxlen: The most values the list will hold. Once full, adding at
+            one end evicts the value at the other end (optional)
+            on_evict: Called with each evicted value (optional)
+        """
+        if maxlen is not None and maxlen < 1:
+            raise Exception('maxlen must be at least 1')
+
+        self.sentinel = DLNode()
+        self.sentinel.next = self.sentinel
+        self.sentinel.prev = self.sentinel
+        self._size = 0
+        self._modcount = 0  # bumped on every change, for iterators
+
+        # value -> set of Nodes holding that value, None when not indexing
+        self._index = {} if index_values else None
+
+        self.maxlen = maxlen
+        self.on_evict = on_evict
+        self._stats = None  # an OpStats once enable_stats is called
+
+        # the Nodes handed out as handles that are still in the list, None
+        # until the first handle is asked for
+        self._handles = None
+
+        # (index, Node, modcount) of the last Node found by index, so walks to
+        # a nearby index can start from there while the list is unchanged
+        self._cursor = None
+
+        # set by reverse(). While it is set the front of the list is at
+        # sentinel.prev and moving towards the back follows prev, so reversing
+        # never has to touch the Nodes.
+        self._reversed = False
+
+        # populate list with initial set of nodes (if provided)
+        if start_list is not None:
+            self.extend_back(start_list)
+
+    def __str__(self):
+        """
+        Returns a human readable string of the list content of the form
+        [value1 <-> value2 <-> value3]
+
+        An empty list should just print []
+
+        Returns:
+            The string of the human readable list representation
+        """
+        return '[' + ' <-> '.join([str(data) for data in self]) + ']'
+
+    def __len__(self):
+        """
+        Returns the number of data nodes in the list
+
+        Returns:
+            The number of elements in the list
+        """
+        return self._size
+
+    def __iter__(self):
+        """
+        Walks the list from front to back. Changing the list while the walk is
+        going on raises an exception on the next step.
+
+        Returns:
+            A generator over the data of each data Node
+        """
+        return self._walk(not self._reversed, self._modcount)
+
+    def __reversed__(self):
+        """
+        Walks the list from back to front. Changing the list while the walk is
+        going on raises an exception on the next step.
+
+        Returns:
+            A generator over the data of each data Node
+        """
+        return self._walk(self._reversed, self._modcount)
+
+    def _walk(self, along_next, modcount):
+        """
+        Walks every data Node following next or following prev. The direction
+        and modcount are taken when the walk is asked for, so a reverse()
+        before the first step is caught too.
+
+        Args:
+            along_next: True to follow next from sentinel.next, False to follow
+            prev from sentinel.prev
+            modcount: The modcount the list must keep for the walk to go on
+
+        Returns:
+            A generator over the data of each data Node
+        """
+        if self._modcount != modcount:
+            raise Exception('List modified during iteration')
+        if along_next:
+            cur = self.sentinel.next
+            while cur is not self.sentinel:
+                yield cur.data
+                if self._modcount != modcount:
+                    raise Exception('List modified during iteration')
+                cur = cur.next
+        else:
+            cur = self.sentinel.prev
+            while cur is not self.sentinel:
+                yield cur.data
+                if self._modcount != modcount:
+                    raise Exception('List modified during iteration')
+                cur = cur.prev
+
+    def _physical(self, index):
+        """
+        Turns an index counted from the front of the list into its position
+        counted along next from sentinel.next, which is the other way round
+        while the list is reversed
+
+        Args:
+            index: The index counted from the front
+
+        Returns:
+            The position along next
+        """
+        if self._reversed:
+            return self._size - 1 - index
+        return index
+
+    def _walk_start(self, index):
+        """
+        Picks where a walk to index should start: sentinel.next, sentinel.prev
+        or the cursor left by the last walk, whichever is fewest Nodes away
+
+        Args:
+            index: The position of the node along next, must be in range
+
+        Returns:
+            A tuple of the starting Node and the number of Nodes to move, a
+            negative number meaning a walk backwards
+        """
+        front = index
+        back = self._size - 1 - index
+        if front <= back:
+            start, steps = self.sentinel.next, front
+        else:
+            start, steps = self.sentinel.prev, -back
+
+        # the cursor is only trusted while the list hasn't changed since
+        cursor = self._cursor
+        if cursor is not None and cursor[2] == self._modcount:
+            offset = index - cursor[0]
+            if abs(offset) < abs(steps):
+                start, steps = cursor[1], offset
+        return start, steps
+
+    def _node_at(self, index):
+        """
+        Walks to the data Node at index, starting from whichever end of the
+        list or the cursor is closer, and leaves the cursor there
+
+        Args:
+            index: The index of the node, must be in range
+
+        Returns:
+            The Node at index
+        """
+        return self._node_along(self._physical(index))
+
+    def _node_along(self, index):
+        """
+        Same as _node_at but index is the position along next, see _physical
+
+        Args:
+            index: The position of the node along next, must be in range
+
+        Returns:
+            The Node at that position
+        """
+        cur, steps = self._walk_start(index)
+        if steps >= 0:
+            for num in range(steps):
+                cur = cur.next
+        else:
+            for num in range(-steps):
+                cur = cur.prev
+
+        self._cursor = (index, cur, self._modcount)
+        return cur
+
+    def __getitem__(self, index):
+        """
+        Returns the data at index, negative indexes count back from the end.
+        A slice returns a new list of the same kind holding those values.
+
+        Args:
+            index: An int or a slice
+
+        Returns:
+            The data at index, or a new list for a slice
+        """
+        if isinstance(index, slice):
+            return self.from_iterable(
+                self.islice(index.start, index.stop, index.step),
+                index_values=self._index is not None)
+
+        if index < 0:
+            index += self._size
+        if index < 0 or index >= self._size:
+            raise Exception('Index out of range')
+
+        return self._node_at(index).data
+
+    def islice(self, start=None, stop=None, step=None):
+        """
+        Lazily walks the values picked out by start, stop and step, which work
+        the same as a python slice. The first value is found from whichever end
+        of the list is closer and a negative step walks backwards.
+
+        Args:
+            start: The first index (optional)
+            stop: The index to stop before (optional)
+            step: How many indexes to move each time (optional)
+
+        Returns:
+            A generator over the selected data
+        """
+        positions = range(*slice(start, stop, step).indices(self._size))
+
+        # a reversed list counts along prev, so the same positions are walked
+        # from the other end in the other direction
+        if positions and self._reversed:
+            last = self._size - 1
+            positions = range(last - positions.start, last - positions.stop,
+                              -positions.step)
+
+        return self._walk_positions(positions, self._modcount)
+
+    def _walk_positions(self, positions, modcount):
+        """
+        Walks the data at each of positions, counted along next, see islice.
+        The positions and modcount are taken when the walk is asked for, so a
+        change before the first step is caught too.
+
+        Args:
+            positions: The range of positions along next to walk
+            modcount: The modcount the list must keep for the walk to go on
+
+        Returns:
+            A generator over the selected data
+        """
+        if self._modcount != modcount:
+            raise Exception('List modified during iteration')
+        if not positions:
+            return
+
+        cur = self._node_along(positions[0])
+        remaining = len(positions)
+        while True:
+            yield cur.data
+            remaining -= 1
+            if remaining == 0:
+                return
+            if self._modcount != modcount:
+                raise Exception('List modified during iteration')
+            if positions.step > 0:
+                for num in range(positions.step):
+                    cur = cur.next
+            else:
+                for num in range(-positions.step):
+                    cur = cur.prev
+
+    def write_to(self, fp, sep=' <-> ', limit=None):
+        """
+        Writes the same text as __str__ to fp in chunks instead of building it
+        as one string
+
+        Args:
+            fp: Any file-like object with a write method
+            sep: The string written between two values
+            limit: The most values to write, the rest are summarised as
+            '... (n more)' (optional)
+        """
+        _write_values(fp, iter(self), self._size, sep, limit)
+
+    def dump(self, fp):
+        """
+        Writes a compact snapshot of the values to fp, see load. The values
+        are pickled a chunk at a time, never the Nodes themselves.
+
+        Args:
+            fp: A file opened for writing bytes
+        """
+        _dump_values(fp, iter(self), self._size)
+
+    @classmethod
+    def load(cls, fp, **options):
+        """
+        Builds a new list from a snapshot written by dump, linking the Nodes
+        in as each chunk is read
+
+        Args:
+            fp: A file opened for reading bytes
+            options: Passed on to the constructor (index_values, maxlen, ...)
+
+        Returns:
+            The newly built list
+        """
+        return cls.from_iterable(_load_values(fp), **options)
+
+    def __reduce__(self):
+        """
+        Pickles the list as its values in a flat python list instead of a
+        chain of Nodes, which would recurse once per Node.
+
+        Returns:
+            The class and the constructor arguments that rebuild the list
+        """
+        return self.__class__, (list(self), self._index is not None,
+                                self.maxlen, self.on_evict)
+
+    # ----- instrumentation -----
+
+    def enable_stats(self):
+        """
+        Starts counting calls, Nodes walked and time spent in add_link_before,
+        remove_link, contains and remove. Until this is called those methods
+        only pay for one check that stats are off.
+        """
+        if self._stats is None:
+            self._stats = OpStats()
+
+    def disable_stats(self):
+        """
+        Stops counting and throws the counters away
+        """
+        self._stats = None
+
+    def reset_stats(self):
+        """
+        Zeroes the counters without turning stats off
+        """
+        if self._stats is not None:
+            self._stats.reset()
+
+    def stats(self):
+        """
+        Returns a snapshot of the counters, see OpStats.snapshot
+
+        Returns:
+            A dictionary of operation name -> counters, empty if stats are off
+        """
+        if self._stats is None:
+            return {}
+        return self._stats.snapshot()
+
+    def _walk_length(self, op, index):
+        """
+        Works out how many Nodes add_link_before or remove_link is about to
+        walk past, which only depends on the index
+
+        Args:
+            op: The name of the operation
+            index: The index the operation was called with
+
+        Returns:
+            The number of Nodes the call will walk past
+        """
+        if index <= 0 or index >= self._size:
+            return 0
+        return abs(self._walk_start(self._physical(index))[1])
+
+    def _link_before(self, cur, data):
+        """
+        Links a new Node holding data in directly before cur
+
+        Args:
+            cur: The Node that will follow the new Node, the sentinel links the
+            new Node in at the end of the list
+            data: The data the new node will contain
+
+        Returns:
+            The newly linked Node
+        """
+        new_link = DLNode()  # initialize a new link
+        new_link.data = data  # set new_link data
+        return self._link_node_before(cur, new_link)
+
+    def _link_node_before(self, cur, new_link):
+        """
+        Links new_link in directly before cur. Every insert goes through here so
+        the size and the value index stay in step.
+
+        Args:
+            cur: The Node that will follow new_link
+            new_link: A Node that is not currently in any list
+
+        Returns:
+            new_link
+        """
+
+        # the sentinel makes the front, the back and the middle all the same
+        new_link.prev = cur.prev
+        new_link.next = cur
+        cur.prev.next = new_link
+        cur.prev = new_link
+        self._size += 1
+        self._modcount += 1
+
+        if self._index is not None:
+            _index_add(self._index, new_link)
+        return new_link
+
+    def _unlink(self, cur):
+        """
+        Takes cur out of the list. Every removal goes through here so the size
+        and the value index stay in step.
+
+        Args:
+            cur: The data Node to remove
+        """
+        cur.prev.next = cur.next
+        cur.next.prev = cur.prev
+        self._size -= 1
+        self._modcount += 1
+
+        # don't let a removed Node keep its old neighbours alive
+        cur.prev = None
+        cur.next = None
+
+        if self._index is not None:
+            _index_discard(self._index, cur)
+        if self._handles is not None:
+            self._handles.discard(cur)
+
+    def _recycle(self, old, data, to_front):
+        """
+        Evicts the value in old, a Node at one end of a full list, and reuses
+        the Node to hold data at the other end. Nothing is allocated, so a full
+        list can keep taking values without making garbage. A Node that was
+        handed out as a handle is never reused, since the handle would then
+        point at the new value.
+
+        Args:
+            old: The Node to evict
+            data: The new data for the reused Node
+            to_front: True to put the Node back at the front, False for the back
+
+        Returns:
+            The evicted data
+        """
+        evicted = old.data
+        handed_out = self._handles is not None and old in self._handles
+        self._unlink(old)
+        if handed_out:
+            old = DLNode()
+        old.data = data
+
+        # look up the new neighbour after the unlink, in a list of one the
+        # Node we are reusing was also the one at the other end
+        if to_front:
+            self._link_node_before(self.sentinel.next, old)
+        else:
+            self._link_node_before(self.sentinel, old)
+
+        if self.on_evict is not None:
+            self.on_evict(evicted)
+        return evicted
+
+    def add_link_before(self, data, index, handle=False):
+        """
+        Adds a new link containing data and inserts it before the link at index.
+        If index is 0, it inserts at the beginning of the list.
+
+        Args:
+            data: The data the new node will contain
+            index: The index of the node that will immediately follow the newly
+            added node
+            handle: If True the new node is returned as a handle for
+            remove_node and move_to_front
+        """
+
+        # stats are off unless enable_stats was called, so this is the only
+        # cost they add to a call
+        if self._stats is not None:
+            steps = self._walk_length('add_link_before', index)
+            return self._stats.measure(self, 'add_link_before',
+                                       (data, index, handle), steps)
+
+        # handle an index out of range
+        if index < 0:
+            raise Exception('Index out of range')
+
+        # there's no end that obviously should lose a value, so like a full
+        # collections.deque we refuse the insert
+        if self.maxlen is not None and self._size >= self.maxlen:
+            raise Exception('List is full')
+
+        # if the index is zero the new node is inserted at the beginning.
+        if index == 0:
+            new_link = self.add_front(data, handle=True)
+            return new_link if handle else True
+
+        # if the index is anything else it has to hold a Node already
+        if index >= self._size:
+            raise Exception('Index out of range')
+
+        # walk from the closer end (or the cursor). Before the Node at index
+        # is after it along next while the list is reversed.
+        cur = self._node_at(index)
+        if self._reversed:
+            cur = cur.next
+        new_link = self._link_before(cur, data)
+
+        # leave the cursor on the new Node, which now sits at index
+        self._cursor = (self._physical(index), new_link, self._modcount)
+        if handle:
+            return self._hand_out(new_link)
+
+    def remove_link(self, index):
+        """
+        Removes the link at the location specified by index
+        Args:
+            index: The index of the node that will be removed
+        """
+
+        if self._stats is not None:
+            return self._stats.measure(self, 'remove_link', (index,),
+                                       self._walk_length('remove_link', index))
+
+        if self.sentinel.next == self.sentinel:
+            return False
+
+        # handle an index out of range
+        if index < 0 or index >= self._size:
+            raise Exception('Index out of range')
+
+        cur = self._node_at(index)
+        following = cur.prev if self._reversed else cur.next
+
+        # the sentinel means the Node always has a Node on either side of it,
+        # whether it is at the front, the back or the only Node in the list
+        self._unlink(cur)
+
+        # the Node after the removed one has moved down to index, so removing
+        # or reading the next few indexes only walks a few Nodes
+        if index < self._size:
+            self._cursor = (self._physical(index), following, self._modcount)
+        else:
+            self._cursor = None
+        return True
+
+    def add_front(self, data, handle=False):
+        """
+        Adds a new node at the beginning of the list that contains data. If
+        the list is at maxlen the last value is evicted to make room.
+
+        Args:
+            data: The data the new node will contain
+            handle: If True the new node is returned as a handle for
+            remove_node and move_to_front
+
+        Returns:
+            The new node if handle is True, otherwise the evicted value, or
+            None if nothing was evicted
+        """
+        return self._add_at_end(data, handle, not self._reversed)
+
+    def add_back(self, data, handle=False):
+        """
+        Adds a new node at the end of the list that contains data. If the list
+        is at maxlen the first value is evicted to make room.
+
+        Args:
+            data: The data the new node will contain
+            handle: If True the new node is returned as a handle for
+            remove_node and move_to_front
+
+        Returns:
+            The new node if handle is True, otherwise the evicted value, or
+            None if nothing was evicted
+        """
+        return self._add_at_end(data, handle, self._reversed)
+
+    def _add_at_end(self, data, handle, at_next_end):
+        """
+        Adds data next to the sentinel, evicting from the other end if the
+        list is at maxlen. add_front and add_back pick the end depending on
+        whether the list is reversed.
+
+        Args:
+            data: The data the new node will contain
+            handle: If True the new node is returned
+            at_next_end: True to add at sentinel.next, False at sentinel.prev
+
+        Returns:
+            The new node if handle is True, otherwise the evicted value, or
+            None if nothing was evicted
+        """
+        if self.maxlen is not None and self._size >= self.maxlen:
+            old = self.sentinel.prev if at_next_end else self.sentinel.next
+            evicted = self._recycle(old, data, at_next_end)
+            if not handle:
+                return evicted
+            new_link = self.sentinel.next if at_next_end \
+                else self.sentinel.prev
+            return self._hand_out(new_link)
+
+        if at_next_end:
+            new_link = self._link_before(self.sentinel.next, data)
+        else:
+            new_link = self._link_before(self.sentinel, data)
+        if handle:
+            return self._hand_out(new_link)
+
+    def _hand_out(self, node):
+        """
+        Records that node is being handed out as a handle, so it is never
+        reused for another value and the handle can be checked later
+
+        Args:
+            node: The Node to hand out
+
+        Returns:
+            node
+        """
+        if self._handles is None:
+            self._handles = set()
+        self._handles.add(node)
+        return node
+
+    def _check_handle(self, node):
+        """
+        Makes sure node is a handle to a value still in this list. Handles of
+        removed or evicted values, and handles from other lists, are refused.
+
+        Args:
+            node: A handle returned by one of the add methods
+        """
+        if self._handles is None or node not in self._handles:
+            raise Exception('Node is not in the list')
+
+    def remove_node(self, node):
+        """
+        Removes the value behind a handle without any walk. The handle is
+        refused if it is used again afterwards.
+
+        Args:
+            node: A handle returned by one of the add methods
+
+        Returns:
+            The removed value
+        """
+        self._check_handle(node)
+        data = node.data
+        self._unlink(node)
+        return data
+
+    def move_to_front(self, node):
+        """
+        Moves the value behind a handle to the front of the list without any
+        walk. The handle stays valid.
+
+        Args:
+            node: A handle returned by one of the add methods
+        """
+        self._check_handle(node)
+        if self._reversed:
+            if self.sentinel.prev is node:
+                return
+        elif self.sentinel.next is node:
+            return
+
+        # the Node keeps its value, so the size and value index are unchanged
+        node.prev.next = node.next
+        node.next.prev = node.prev
+
+        # the front is just before the sentinel in a reversed list
+        following = self.sentinel if self._reversed else self.sentinel.next
+        node.prev = following.prev
+        node.next = following
+        following.prev.next = node
+        following.prev = node
+        self._modcount += 1
+
+    @classmethod
+    def from_iterable(cls, iterable, **options):
+        """
+        Builds a new list holding the values of iterable in order
+
+        Args:
+            iterable: The values the new list will contain
+            options: Passed on to the constructor (index_values, maxlen, ...)
+
+        Returns:
+            The newly built list
+        """
+        new_list = cls(**options)
+        new_list.extend_back(iterable)
+        return new_list
+
+    def _build_chain(self, iterable):
+        """
+        Links the values of iterable into a chain of Nodes that is not yet
+        attached to the list
+
+        Args:
+            iterable: The values the chain will contain
+
+        Returns:
+            A tuple of the first Node, the last Node and the number of Nodes,
+            the Nodes are None if iterable was empty
+        """
+        first = None
+        last = None
+        count = 0
+
+        for data in iterable:
+            new_link = DLNode()  # initialize a new link
+            new_link.data = data  # set new_link data
+
+            if last is None:
+                first = new_link
+            else:
+                last.next = new_link
+                new_link.prev = last
+            last = new_link
+            count += 1
+
+        return first, last, count
+
+    def extend_back(self, iterable):
+        """
+        Adds the values of iterable to the end of the list in order
+
+        Args:
+            iterable: The values the new nodes will contain
+        """
+
+        # a bounded list takes the values one at a time so each one can evict
+        # and reuse a Node from the front. Extending a list with itself
+        # copies the values first so the adds don't trip its own iterator.
+        if self.maxlen is not None:
+            if iterable is self:
+                iterable = list(iterable)
+            for data in iterable:
+                self.add_back(data)
+            return
+
+        # the back of a reversed list is at sentinel.next, where the values
+        # go in the other way round
+        if self._reversed:
+            values = list(iterable)
+            values.reverse()
+            self._link_chain(values, True)
+        else:
+            self._link_chain(iterable, False)
+
+    def extend_front(self, iterable):
+        """
+        Adds the values of iterable to the beginning of the list, keeping their
+        order, so the first value of iterable becomes the front of the list
+
+        Args:
+            iterable: The values the new nodes will contain
+        """
+
+        # a bounded list takes the values one at a time, last one first, so
+        # each one can evict and reuse a Node from the back
+        if self.maxlen is not None:
+            for data in reversed(list(iterable)):
+                self.add_front(data)
+            return
+
+        # the front of a reversed list is at sentinel.prev, where the values
+        # go in the other way round
+        if self._reversed:
+            values = list(iterable)
+            values.reverse()
+            self._link_chain(values, False)
+        else:
+            self._link_chain(iterable, True)
+
+    def _link_chain(self, iterable, at_next_end):
+        """
+        Builds a chain of Nodes holding the values of iterable and splices it
+        in next to the sentinel, keeping its order along next
+
+        Args:
+            iterable: The values the new nodes will contain
+            at_next_end: True to splice it in before sentinel.next, False to
+            splice it in after sentinel.prev
+        """
+        first, last, count = self._build_chain(iterable)
+        if count == 0:
+            return
+
+        if at_next_end:
+            # splice the chain in between the sentinel and the first Node
+            first.prev = self.sentinel
+            last.next = self.sentinel.next
+            self.sentinel.next.prev = last
+            self.sentinel.next = first
+        else:
+            # splice the chain in between the last Node and the sentinel
+            first.prev = self.sentinel.prev
+            last.next = self.sentinel
+            self.sentinel.prev.next = first
+            self.sentinel.prev = last
+        self._size += count
+        self._modcount += 1
+
+        # the values are only indexed once they are really in the list, so a
+        # failing iterable leaves nothing behind in the index
+        if self._index is not None:
+            _index_chain(self._index, first, count)
+
+    def _move_chain(self, other, first, last, count, cur):
+        """
+        Moves the count Nodes from first to last out of other and links them in
+        before cur. The relinking is constant time, only a value index or
+        handles on either list make it walk the moved Nodes to move their
+        entries.
+
+        Args:
+            other: The CircularList the Nodes are in now
+            first: The first Node to move
+            last: The last Node to move
+            count: The number of Nodes from first to last
+            cur: The Node in this list the moved Nodes will come before
+        """
+
+        # unhook the chain from other, closing the gap it leaves
+        first.prev.next = last.next
+        last.next.prev = first.prev
+        other._size -= count
+        other._modcount += 1
+
+        # and hook it in before cur
+        first.prev = cur.prev
+        last.next = cur
+        cur.prev.next = first
+        cur.prev = last
+        self._size += count
+        self._modcount += 1
+
+        # every entry of an emptied list's index belonged to the moved Nodes
+        if other._index is not None and other._size == 0:
+            other._index = {}
+        elif other._index is not None:
+            node = first
+            for number in range(count):
+                _index_discard(other._index, node)
+                node = node.next
+
+        if self._index is not None:
+            _index_chain(self._index, first, count)
+
+        # handles follow their Nodes, so they can be used on this list now
+        if other._handles:
+            if self._handles is None:
+                self._handles = set()
+            if other._size == 0:
+                self._handles |= other._handles
+                other._handles = set()
+            else:
+                node = first
+                for number in range(count):
+                    if node in other._handles:
+                        other._handles.discard(node)
+                        self._handles.add(node)
+                    node = node.next
+
+    def concat(self, other):
+        """
+        Moves every Node of other onto the end of this list, leaving other
+        empty. No Node is copied or allocated. A bounded list then evicts from
+        the front until it is back to maxlen, like add_back would.
+
+        Args:
+            other: Another CircularList
+        """
+        if other is self:
+            raise Exception('Cannot concat a list onto itself')
+        if other._size == 0:
+            return
+        self._normalize()
+        other._normalize()
+
+        self._move_chain(other, other.sentinel.next, other.sentinel.prev,
+                         other._size, self.sentinel)
+
+        if self.maxlen is not None:
+            while self._size > self.maxlen:
+                evicted = self.sentinel.next.data
+                self._unlink(self.sentinel.next)
+                if self.on_evict is not None:
+                    self.on_evict(evicted)
+
+    def split_at(self, index):
+        """
+        Cuts the list in two at index. This list keeps the values before index
+        and the rest move, Nodes and all, to a new list with the same options.
+        Finding the cut walks from the closer end, the cut itself is constant
+        time.
+
+        Args:
+            index: The index of the first value to move, from 0 to the size
+
+        Returns:
+            A new CircularList holding the values from index on
+        """
+        if index < 0 or index > self._size:
+            raise Exception('Index out of range')
+
+        new_list = self.__class__(index_values=self._index is not None,
+                                  maxlen=self.maxlen, on_evict=self.on_evict)
+        if index == self._size:
+            return new_list
+        self._normalize()
+
+        new_list._move_chain(self, self._node_at(index), self.sentinel.prev,
+                             self._size - index, new_list.sentinel)
+        return new_list
+
+    def splice(self, index, other):
+        """
+        Moves every Node of other into this list before index, leaving other
+        empty. No Node is copied or allocated. Like add_link_before on a full
+        list, a bounded list without room for all of other refuses the splice.
+
+        Args:
+            index: The index the first value of other will end up at, from 0 to
+            the size
+            other: Another CircularList
+        """
+        if other is self:
+            raise Exception('Cannot splice a list into itself')
+        if index < 0 or index > self._size:
+            raise Exception('Index out of range')
+        if self.maxlen is not None and self._size + other._size > self.maxlen:
+            raise Exception('List is full')
+        if other._size == 0:
+            return
+        self._normalize()
+        other._normalize()
+
+        if index == self._size:
+            cur = self.sentinel
+        else:
+            cur = self._node_at(index)
+        self._move_chain(other, other.sentinel.next, other.sentinel.prev,
+                         other._size, cur)
+
+    def get_front(self):
+        """
+        Returns the data in the element at the front of the list. Will return
+        None in an empty list.
+
+        Returns:
+            The data in the node at index 0 or None if there is no such node
+        """
+
+        if self._reversed:
+            return self.sentinel.prev.data
+        return self.sentinel.next.data
+
+    def get_back(self):
+        """
+        Returns the data in the element at the end of the list. Will return
+        None in an empty list.
+
+        Returns:
+            The data in the node at last index of the list or None if there is
+            no such node
+        """
+
+        if self._reversed:
+            return self.sentinel.next.data
+        return self.sentinel.prev.data
+
+    def remove_front(self):
+        """
+        Removes the first element of the list. Will not remove the tail.
+        """
+
+        if self.sentinel.next == self.sentinel:
+            return False
+        elif self._reversed:
+            self._unlink(self.sentinel.prev)
+            return True
+        else:
+            self._unlink(self.sentinel.next)
+            return True
+
+    def remove_back(self):
+        """
+        Removes the last element of the list. Will not remove the head.
+        """
+
+        if self.sentinel.prev == self.sentinel:
+            return False
+        elif self._reversed:
+            self._unlink(self.sentinel.next)
+            return True
+        else:
+            self._unlink(self.sentinel.prev)
+            return True
+
+    def sort(self, key=None, reverse=False):
+        """
+        Sorts the list in place with a stable bottom up merge sort that only
+        relinks the existing Nodes, nothing is copied or allocated per value.
+        If a comparison raises, the list keeps all of its values but in no
+        particular order.
+
+        Args:
+            key: Called once on each value to get what to sort by (optional)
+            reverse: If True the list is sorted largest first
+        """
+        if self._size < 2:
+            return
+        self._normalize()
+
+        # like sorted() each key is worked out once, not once per comparison
+        keys = None
+        if key is not None:
+            keys = {}
+            cur = self.sentinel.next
+            while cur != self.sentinel:
+                keys[cur] = key(cur.data)
+                cur = cur.next
+
+        dummy = DLNode()
+        first = None
+        try:
+            first = _merge_sort_chain(self.sentinel.next, self._size, keys,
+                                      reverse, dummy)
+        except BaseException:
+            first = dummy.next
+            raise
+        finally:
+            # the sort only follows next, so the prev fields are set again in
+            # one pass and the chain is closed back onto the sentinel
+            prev = self.sentinel
+            cur = first
+            for number in range(self._size):
+                prev.next = cur
+                cur.prev = prev
+                prev = cur
+                cur = cur.next
+            prev.next = self.sentinel
+            self.sentinel.prev = prev
+            self._modcount += 1
+
+    def insert_sorted(self, data, key=None, reverse=False):
+        """
+        Adds data after every value that sorts before or equal to it, so a list
+        that was sorted with the same key and reverse stays sorted. Equal
+        values keep the order they were inserted in. The walk starts at the
+        back, so values arriving roughly in order are cheap to insert.
+
+        Args:
+            data: The data the new node will contain
+            key: Called on each value to get what to sort by (optional)
+            reverse: If True the list is kept largest first
+
+        Returns:
+            The index the new node was inserted at
+        """
+        if self.maxlen is not None and self._size >= self.maxlen:
+            raise Exception('List is full')
+        self._normalize()
+
+        new_key = data if key is None else key(data)
+
+        def goes_before(node):
+            node_key = node.data if key is None else key(node.data)
+            return node_key < new_key if reverse else new_key < node_key
+
+        # walk back past every value the new one sorts before
+        cur = self.sentinel.prev
+        index = self._size
+        while cur != self.sentinel and goes_before(cur):
+            cur = cur.prev
+            index -= 1
+
+        self._link_before(cur.next, data)
+        return index
+
+    def is_empty(self):
+        """
+        Checks if the list is empty
+
+        Returns:
+            True if the list has no data nodes, False otherwise
+        """
+
+        if self.sentinel.next == self.sentinel:
+            return True
+        else:
+            return False
+
+    def contains(self, value):
+        """
+        Checks if any node contains value
+
+        Args:
+            value: The value to look for
+
+        Returns:
+            True if value is in the list, False otherwise
+        """
+
+        if self._stats is not None:
+            return self._stats.count('contains', self._contains, value)
+        return self._contains(value)[0]
+
+    def _contains(self, value):
+        """
+        The walk behind contains, counting the Nodes it looks at
+
+        Args:
+            value: The value to look for
+
+        Returns:
+            A tuple of True or False and the number of Nodes looked at
+        """
+
+        # with a value index a hashable value is a single dictionary lookup
+        if self._index is not None:
+            try:
+                return value in self._index, 0
+            except TypeError:
+                pass
+
+        cur, steps = self._find(value, None)
+        return cur is not None, steps
+
+    def _find(self, value, bucket):
+        """
+        Walks in list order to the first Node holding value, or to the first of
+        the Nodes in bucket when one is given. Counting the steps with a range
+        over the size costs no more than checking for the sentinel, so every
+        walk counts.
+
+        Args:
+            value: The value to look for
+            bucket: A set of the Nodes holding value, from the value index
+            (optional)
+
+        Returns:
+            A tuple of the Node found, None if there is none, and the number of
+            Nodes looked at
+        """
+
+        # walk in list order so the comparisons happen in the same order as
+        # for an unreversed list, and the first instance is the one nearest
+        # sentinel.prev when reversed
+        along_next = not self._reversed
+        cur = self.sentinel.next if along_next else self.sentinel.prev
+        if bucket is not None:
+            for steps in range(1, self._size + 1):
+                if cur in bucket:
+                    return cur, steps
+                cur = cur.next if along_next else cur.prev
+        else:
+            for steps in range(1, self._size + 1):
+                if cur.data == value:
+                    return cur, steps
+                cur = cur.next if along_next else cur.prev
+        return None, self._size
+
+    def contains_many(self, values):
+        """
+        Checks which of values are in the list with a single walk, instead of
+        one walk per value
+
+        Args:
+            values: The values to look for
+
+        Returns:
+            A python list of True or False for each of values, in order
+        """
+        return _contains_many(self, self._index, values)
+
+    def count_many(self, values):
+        """
+        Counts how many times each of values is in the list with a single walk
+
+        Args:
+            values: The values to count
+
+        Returns:
+            A python list of the count of each of values, in order
+        """
+        return _count_many(self, self._index, values)
+
+    def index_many(self, values):
+        """
+        Finds the index of the first instance of each of values with a single
+        walk, which stops once all of them have been found
+
+        Args:
+            values: The values to look for
+
+        Returns:
+            A python list of the index of each of values, or None where a
+            value isn't in the list, in order
+        """
+        counts, firsts = _scan_many(self, values, False)
+        return firsts
+
+    def index_of(self, value):
+        """
+        Finds the index of the first instance of value
+
+        Args:
+            value: The value to look for
+
+        Returns:
+            The index of value, or None if it isn't in the list
+        """
+        return self.index_many([value])[0]
+
+    def remove(self, value):
+        """
+        Removes the first instance of an element from the list
+
+        Args:
+            value: the value to remove
+        """
+
+        if self._stats is not None:
+            return self._stats.count('remove', self._remove, value)
+        return self._remove(value)[0]
+
+    def _remove(self, value):
+        """
+        The walk behind remove, counting the Nodes it looks at
+
+        Args:
+            value: the value to remove
+
+        Returns:
+            A tuple of True if a value was removed, False otherwise, and the
+            number of Nodes looked at
+        """
+
+        # with a value index a value held by a single Node is unlinked straight
+        # away. If several Nodes hold it we still walk to find which one of
+        # them comes first, but only checking Node identity on the way.
+        bucket = None
+        if self._index is not None:
+            try:
+                bucket = self._index.get(value)
+            except TypeError:
+                pass
+            else:
+                if bucket is None:
+                    return False, 0
+                if len(bucket) == 1:
+                    self._unlink(next(iter(bucket)))
+                    return True, 0
+
+        cur, steps = self._find(value, bucket)
+        if cur is None:
+            return False, steps
+        self._unlink(cur)
+        return True, steps
+
+    def _remove_where(self, match, on_remove):
+        """
+        Unlinks every Node whose data match returns True for, in one walk. The
+        survivors keep their order.
+
+        Args:
+            match: Called with each value, True means remove it
+            on_remove: Called with each removed value once the walk is over,
+            so it is free to change the list (optional)
+
+        Returns:
+            The number of values removed
+        """
+        count = 0
+        removed = [] if on_remove is not None else None
+
+        # walk in list order, which is along prev from sentinel.prev when
+        # reversed, so match and on_remove see the values front to back
+        along_next = not self._reversed
+        cur = self.sentinel.next if along_next else self.sentinel.prev
+        try:
+            while cur != self.sentinel:
+                following = cur.next if along_next else cur.prev
+                if match(cur.data):
+                    if removed is not None:
+                        removed.append(cur.data)
+                    count += 1
+                    self._unlink(cur)
+                cur = following
+        finally:
+            # values already taken out are still reported if match raised
+            if removed is not None:
+                for data in removed:
+                    on_remove(data)
+        return count
+
+    def remove_all(self, value, on_remove=None):
+        """
+        Removes every instance of value from the list in a single walk, unlike
+        calling remove until it fails which starts a new walk each time
+
+        Args:
+            value: The value to remove
+            on_remove: Called with each removed value (optional)
+
+        Returns:
+            The number of values removed
+        """
+
+        # with a value index the Nodes holding value are unlinked directly,
+        # without walking the rest of the list
+        if self._index is not None:
+            try:
+                bucket = self._index.get(value)
+            except TypeError:
+                pass
+            else:
+                if bucket is None:
+                    return 0
+                nodes = list(bucket)
+
+                # the index keeps no order, so when on_remove has to see the
+                # values front to back we walk the list for them, only
+                # checking Node identity
+                if on_remove is not None and len(nodes) > 1:
+                    nodes = []
+                    along_next = not self._reversed
+                    cur = self.sentinel.next if along_next \
+                        else self.sentinel.prev
+                    while len(nodes) < len(bucket):
+                        if cur in bucket:
+                            nodes.append(cur)
+                        cur = cur.next if along_next else cur.prev
+                removed = [node.data for node in nodes]
+                for node in nodes:
+                    self._unlink(node)
+                if on_remove is not None:
+                    for data in removed:
+                        on_remove(data)
+                return len(removed)
+
+        return self._remove_where(lambda data: data == value, on_remove)
+
+    def remove_if(self, predicate, on_remove=None):
+        """
+        Removes every value predicate returns True for, in a single walk
+
+        Args:
+            predicate: Called with each value
+            on_remove: Called with each removed value (optional)
+
+        Returns:
+            The number of values removed
+        """
+        return self._remove_where(predicate, on_remove)
+
+    def retain(self, predicate, on_remove=None):
+        """
+        Keeps only the values predicate returns True for, removing the rest in
+        a single walk
+
+        Args:
+            predicate: Called with each value
+            on_remove: Called with each removed value (optional)
+
+        Returns:
+            The number of values removed
+        """
+        return self._remove_where(lambda data: not predicate(data), on_remove)
+
+    def reverse(self):
+        """
+        Reverses the order of the values in constant time. No Node is touched,
+        the list just starts treating sentinel.prev as its front, so the
+        front and back methods, indexing and iteration all see the new order.
+        circularListReverse still flips the Nodes themselves.
+        """
+        self._reversed = not self._reversed
+        self._modcount += 1
+
+    def _normalize(self):
+        """
+        Flips the Nodes of a reversed list so its front is at sentinel.next
+        again, for the methods that relink whole chains of Nodes and assume
+        that. The values keep their order.
+        """
+        if self._reversed:
+            self._reversed = False
+            self.circularListReverse()
+
+    def circularListReverse(self):
+        """
+        Reverses the order of the links. It must not create any additional new
+        links to do so. (e.g. you cannot call DLNode()). If the list printed by
+        following next was 0, 1, 2, 3, after the call it will be 3,2,1,0
+        """
+
+        # set a base case where we are looking at the 1st and 2nd node
+        cur = self.sentinel.next
+        next_node = cur.next
+
+        # takes a Node and flips their prev and next values
+        while cur != self.sentinel:
+            cur.next = cur.prev
+            cur.prev = next_node
+            cur = next_node
+            next_node = cur.next
+
+        # since hitting the sentinel is what stops the loop we have to
+        # manually set the prev and next values for sentinel to close the loop
+        hold_me = cur.prev
+        cur.prev = cur.next
+        cur.next = hold_me
+        self._modcount += 1
+        return
+
+'''
+*******************************************************************************
+Part 3: Deque and Bag implemented with an unrolled Circular Linked List
+*******************************************************************************
+'''
+
+
+class DLBlock:
+    # a DLNode that holds a small python list of values instead of one value
+    __slots__ = ('next', 'prev', 'data')
+
+    def __init__(self):
+        self.next = None
+        self.prev = None
+        self.data = []
+
+
+class UnrolledCircularList:
+    def __init__(self, start_list=None, block_size=64):
+        """
+        Initializes an unrolled linked list with a single sentinel block that
+        never holds any data. Every other block holds up to block_size values,
+        so walks and scans can skip a whole block at a time.
+
+        Args:
+            start_list: The values to populate the list with (optional)
+            block_size: The most values a single block will hold
+        """
+        if block_size < 2:
+            raise Exception('Block size must be at least 2')
+
+        self.block_size = block_size
+        self.sentinel = DLBlock()
+        self.sentinel.next = self.sentinel
+        self.sentinel.prev = self.sentinel
+        self._size = 0
+        self._modcount = 0  # bumped on every change, for iterators
+
+        # populate list with initial set of nodes (if provided)
+        if start_list is not None:
+            self.extend_back(start_list)
+
+    @classmethod
+    def from_iterable(cls, iterable, block_size=64):
+        """
+        Builds a new list holding the values of iterable in order
+
+        Args:
+            iterable: The values the new list will contain
+            block_size: The most values a single block will hold
+
+        Returns:
+            The newly built list
+        """
+        new_list = cls(block_size=block_size)
+        new_list.extend_back(iterable)
+        return new_list
+
+    def __str__(self):
+        """
+        Returns a human readable string of the list content of the form
+        [value1 <-> value2 <-> value3]
+
+        An empty list should just print []
+
+        Returns:
+            The string of the human readable list representation
+        """
+        return '[' + ' <-> '.join([str(data) for data in self]) + ']'
+
+    def __len__(self):
+        """
+        Returns the number of values in the list
+
+        Returns:
+            The number of elements in the list
+        """
+        return self._size
+
+    def __iter__(self):
+        """
+        Walks the list from front to back. Changing the list while the walk is
+        going on raises an exception on the next step.
+
+        Returns:
+            A generator over the values of each block
+        """
+        return self._walk(True, self._modcount)
+
+    def __reversed__(self):
+        """
+        Walks the list from back to front. Changing the list while the walk is
+        going on raises an exception on the next step.
+
+        Returns:
+            A generator over the values of each block
+        """
+        return self._walk(False, self._modcount)
+
+    def _walk(self, along_next, modcount):
+        """
+        Walks every value following next or following prev. The modcount is
+        taken when the walk is asked for, so a change before the first step is
+        caught too.
+
+        Args:
+            along_next: True to walk front to back, False for back to front
+            modcount: The modcount the list must keep for the walk to go on
+
+        Returns:
+            A generator over the values of each block
+        """
+        if self._modcount != modcount:
+            raise Exception('List modified during iteration')
+        if along_next:
+            block = self.sentinel.next
+            while block is not self.sentinel:
+                for data in block.data:
+                    yield data
+                    if self._modcount != modcount:
+                        raise Exception('List modified during iteration')
+                block = block.next
+        else:
+            block = self.sentinel.prev
+            while block is not self.sentinel:
+                for data in reversed(block.data):
+                    yield data
+                    if self._modcount != modcount:
+                        raise Exception('List modified during iteration')
+                block = block.prev
+
+    def __getitem__(self, index):
+        """
+        Returns the value at index, negative indexes count back from the end.
+        A slice returns a new list of the same kind holding those values.
+
+        Args:
+            index: An int or a slice
+
+        Returns:
+            The value at index, or a new list for a slice
+        """
+        if isinstance(index, slice):
+            positions = range(*index.indices(self._size))
+            if positions.step > 0:
+                values = self._values_at(positions)
+            else:
+                values = self._values_at(positions[::-1])[::-1]
+            return self.from_iterable(values, block_size=self.block_size)
+
+        if index < 0:
+            index += self._size
+        if index < 0 or index >= self._size:
+            raise Exception('Index out of range')
+
+        block, offset = self._locate(index)
+        return block.data[offset]
+
+    def _values_at(self, positions):
+        """
+        Collects the values at each of positions, finding the first block once
+        and stepping through the blocks from there
+
+        Args:
+            positions: A range of indexes with a positive step
+
+        Returns:
+            A python list of the values
+        """
+        values = []
+        if not positions:
+            return values
+
+        block, offset = self._locate(positions[0])
+        remaining = len(positions)
+        while True:
+            values.append(block.data[offset])
+            remaining -= 1
+            if remaining == 0:
+                return values
+            offset += positions.step
+            while offset >= len(block.data):
+                offset -= len(block.data)
+                block = block.next
+
+    def write_to(self, fp, sep=' <-> ', limit=None):
+        """
+        Writes the same text as __str__ to fp in chunks instead of building it
+        as one string
+
+        Args:
+            fp: Any file-like object with a write method
+            sep: The string written between two values
+            limit: The most values to write, the rest are summarised as
+            '... (n more)' (optional)
+        """
+        _write_values(fp, iter(self), self._size, sep, limit)
+
+    def _link_block_after(self, prev_block):
+        """
+        Links a new empty block in directly after prev_block
+
+        Args:
+            prev_block: The block the new block will follow
+
+        Returns:
+            The newly linked block
+        """
+        block = DLBlock()
+        block.prev = prev_block
+        block.next = prev_block.next
+        prev_block.next.prev = block
+        prev_block.next = block
+        return block
+
+    def _unlink_block(self, block):
+        """
+        Takes block out of the chain of blocks
+
+        Args:
+            block: The block to remove
+        """
+        block.prev.next = block.next
+        block.next.prev = block.prev
+
+    def _locate(self, index):
+        """
+        Finds the block holding the value at index, walking from whichever end
+        of the list is closer and skipping a whole block per step
+
+        Args:
+            index: The index of the value to find, must be in range
+
+        Returns:
+            A tuple of the block and the offset of the value inside the block
+        """
+
+        # walk forward from the front
+        if index < self._size // 2:
+            block = self.sentinel.next
+            while index >= len(block.data):
+                index -= len(block.data)
+                block = block.next
+            return block, index
+
+        # walk backward from the back, counting how far from the end we are
+        from_end = self._size - 1 - index
+        block = self.sentinel.prev
+        while from_end >= len(block.data):
+            from_end -= len(block.data)
+            block = block.prev
+        return block, len(block.data) - 1 - from_end
+
+    def _merge_small(self, block):
+        """
+        Folds block into its next neighbour when the two of them together would
+        only fill half a block, so removals don't leave lots of tiny blocks
+
+        Args:
+            block: The block that just lost a value
+        """
+        if not block.data:
+            self._unlink_block(block)
+            return
+
+        nxt = block.next
+        if nxt is not self.sentinel and \
+                len(block.data) + len(nxt.data) <= self.block_size // 2:
+            block.data.extend(nxt.data)
+            self._unlink_block(nxt)
+
+    def add_link_before(self, data, index):
+        """
+        Adds a new value and inserts it before the value at index.
+        If index is 0, it inserts at the beginning of the list.
+
+        Args:
+            data: The value to add
+            index: The index of the value that will immediately follow the newly
+            added value
+        """
+
+        # handle an index out of range
+        if index < 0:
+            raise Exception('Index out of range')
+
+        # if the index is zero the new value is inserted at the beginning.
+        if index == 0:
+            self.add_front(data)
+            return True
+
+        if index >= self._size:
+            raise Exception('Index out of range')
+
+        block, offset = self._locate(index)
+
+        # a full block is split in half first so the insert stays cheap
+        if len(block.data) >= self.block_size:
+            half = len(block.data) // 2
+            new_block = self._link_block_after(block)
+            new_block.data = block.data[half:]
+            del block.data[half:]
+            if offset >= half:
+                block = new_block
+                offset -= half
+
+        block.data.insert(offset, data)
+        self._size += 1
+        self._modcount += 1
+
+    def remove_link(self, index):
+        """
+        Removes the value at the location specified by index
+        Args:
+            index: The index of the value that will be removed
+        """
+        if self._size == 0:
+            return False
+
+        # handle an index out of range
+        if index < 0 or index >= self._size:
+            raise Exception('Index out of range')
+
+        block, offset = self._locate(index)
+        del block.data[offset]
+        self._size -= 1
+        self._modcount += 1
+        self._merge_small(block)
+        return True
+
+    def add_front(self, data):
+        """
+        Adds a new value at the beginning of the list
+
+        Args:
+            data: The value to add
+        """
+
+        # we only need a new block when the first one is full (or missing)
+        block = self.sentinel.next
+        if block is self.sentinel or len(block.data) >= self.block_size:
+            block = self._link_block_after(self.sentinel)
+
+        block.data.insert(0, data)
+        self._size += 1
+        self._modcount += 1
+
+    def add_back(self, data):
+        """
+        Adds a new value at the end of the list
+
+        Args:
+            data: The value to add
+        """
+
+        # we only need a new block when the last one is full (or missing)
+        block = self.sentinel.prev
+        if block is self.sentinel or len(block.data) >= self.block_size:
+            block = self._link_block_after(self.sentinel.prev)
+
+        block.data.append(data)
+        self._size += 1
+        self._modcount += 1
+
+    def extend_back(self, iterable):
+        """
+        Adds the values of iterable to the end of the list in order
+
+        Args:
+            iterable: The values to add
+        """
+        for data in iterable:
+            self.add_back(data)
+
+    def extend_front(self, iterable):
+        """
+        Adds the values of iterable to the beginning of the list, keeping their
+        order, so the first value of iterable becomes the front of the list
+
+        Args:
+            iterable: The values to add
+        """
+        for data in reversed(list(iterable)):
+            self.add_front(data)
+
+    def get_front(self):
+        """
+        Returns the value at the front of the list. Will return None in an
+        empty list.
+
+        Returns:
+            The value at index 0 or None if there is no such value
+        """
+        if self._size == 0:
+            return None
+        return self.sentinel.next.data[0]
+
+    def get_back(self):
+        """
+        Returns the value at the end of the list. Will return None in an empty
+        list.
+
+        Returns:
+            The value at the last index of the list or None if there is no such
+            value
+        """
+        if self._size == 0:
+            return None
+        return self.sentinel.prev.data[-1]
+
+    def remove_front(self):
+        """
+        Removes the first value of the list.
+        """
+        if self._size == 0:
+            return False
+
+        block = self.sentinel.next
+        del block.data[0]
+        self._size -= 1
+        self._modcount += 1
+        if not block.data:
+            self._unlink_block(block)
+        return True
+
+    def remove_back(self):
+        """
+        Removes the last value of the list.
+        """
+        if self._size == 0:
+            return False
+
+        block = self.sentinel.prev
+        block.data.pop()
+        self._size -= 1
+        self._modcount += 1
+        if not block.data:
+            self._unlink_block(block)
+        return True
+
+    def is_empty(self):
+        """
+        Checks if the list is empty
+
+        Returns:
+            True if the list has no values, False otherwise
+        """
+        return self._size == 0
+
+    def contains(self, value):
+        """
+        Checks if any block contains value
+
+        Args:
+            value: The value to look for
+
+        Returns:
+            True if value is in the list, False otherwise
+        """
+
+        # compare with == like the other lists do, python's own list scan
+        # checks identity first and would find nan in a block
+        block = self.sentinel.next
+        while block is not self.sentinel:
+            for data in block.data:
+                if data == value:
+                    return True
+            block = block.next
+        return False
+
+    def remove(self, value):
+        """
+        Removes the first instance of a value from the list
+
+        Args:
+            value: the value to remove
+        """
+        block = self.sentinel.next
+        while block is not self.sentinel:
+            for i, data in enumerate(block.data):
+                if data == value:
+                    del block.data[i]
+                    self._size -= 1
+                    self._modcount += 1
+                    self._merge_small(block)
+                    return True
+            block = block.next
+        return False
+
+    def circularListReverse(self):
+        """
+        Reverses the order of the values. It does not create any new blocks,
+        the chain of blocks is flipped and each block is reversed in place.
+        """
+        self._modcount += 1
+        block = self.sentinel
+        while True:
+            block.next, block.prev = block.prev, block.next
+            block.data.reverse()
+            block = block.prev  # prev is the old next after the swap
+            if block is self.sentinel:
+                return
+
+
+'''
+*******************************************************************************
+Part 4: Deque and Bag implemented with an indexable skip list
+*******************************************************************************
+'''
+
+
+class SkipNode:
+    # next and width hold one entry per level the Node is linked into, the
+    # width of a link is how many positions it jumps forward. prev is only kept
+    # for the bottom level, which is a regular circular doubly linked list.
+    __slots__ = ('next', 'width', 'prev', 'data')
+
+    def __init__(self, height):
+        self.next = [None] * height
+        self.width = [0] * height
+        self.prev = None
+        self.data = None
+
+
+class IndexedCircularList:
+    # the most levels a Node can be linked into, plenty for 2 ** 32 values
+    MAX_LEVEL = 32
+
+    def __init__(self, start_list=None):
+        """
+        Initializes an indexable skip list with a single sentinel node that is
+        linked into every level. Inserting, removing and getting by index take
+        O(log n) expected time instead of a walk through the whole list.
+
+        Args:
+            start_list: The values to populate the list with (optional)
+        """
+        self.sentinel = SkipNode(self.MAX_LEVEL)
+        for level in range(self.MAX_LEVEL):
+            self.sentinel.next[level] = self.sentinel
+            self.sentinel.width[level] = 1
+        self.sentinel.prev = self.sentinel
+
+        self._level = 1  # the number of levels currently in use
+        self._size = 0
+        self._modcount = 0  # bumped on every change, for iterators
+
+        # populate list with initial set of nodes (if provided)
+        if start_list is not None:
+            self.extend_back(start_list)
+
+    @classmethod
+    def from_iterable(cls, iterable):
+        """
+        Builds a new list holding the values of iterable in order
+
+        Args:
+            iterable: The values the new list will contain
+
+        Returns:
+            The newly built list
+        """
+        new_list = cls()
+        new_list.extend_back(iterable)
+        return new_list
+
+    def __str__(self):
+        """
+        Returns a human readable string of the list content of the form
+        [value1 <-> value2 <-> value3]
+
+        An empty list should just print []
+
+        Returns:
+            The string of the human readable list representation
+        """
+        return '[' + ' <-> '.join([str(data) for data in self]) + ']'
+
+    def __len__(self):
+        """
+        Returns the number of data nodes in the list
+
+        Returns:
+            The number of elements in the list
+        """
+        return self._size
+
+    def __iter__(self):
+        """
+        Walks the bottom level of the list from front to back. Changing the
+        list while the walk is going on raises an exception on the next step.
+
+        Returns:
+            A generator over the data of each data Node
+        """
+        return self._walk(True, self._modcount)
+
+    def __reversed__(self):
+        """
+        Walks the bottom level of the list from back to front. Changing the
+        list while the walk is going on raises an exception on the next step.
+
+        Returns:
+            A generator over the data of each data Node
+        """
+        return self._walk(False, self._modcount)
+
+    def _walk(self, along_next, modcount):
+        """
+        Walks every data Node of the bottom level following next or following
+        prev. The modcount is taken when the walk is asked for, so a change
+        before the first step is caught too.
+
+        Args:
+            along_next: True to walk front to back, False for back to front
+            modcount: The modcount the list must keep for the walk to go on
+
+        Returns:
+            A generator over the data of each data Node
+        """
+        if self._modcount != modcount:
+            raise Exception('List modified during iteration')
+        if along_next:
+            cur = self.sentinel.next[0]
+            while cur is not self.sentinel:
+                yield cur.data
+                if self._modcount != modcount:
+                    raise Exception('List modified during iteration')
+                cur = cur.next[0]
+        else:
+            cur = self.sentinel.prev
+            while cur is not self.sentinel:
+                yield cur.data
+                if self._modcount != modcount:
+                    raise Exception('List modified during iteration')
+                cur = cur.prev
+
+    def __getitem__(self, index):
+        """
+        Returns the data at index, negative indexes count back from the end.
+        A slice returns a new list of the same kind holding those values.
+
+        Args:
+            index: An int or a slice
+
+        Returns:
+            The data at index, or a new list for a slice
+        """
+        if isinstance(index, slice):
+            positions = range(*index.indices(self._size))
+            if positions.step > 0:
+                values = self._values_at(positions)
+            else:
+                values = self._values_at(positions[::-1])[::-1]
+            return self.from_iterable(values)
+
+        if index < 0:
+            index += self._size
+        return self.get(index)
+
+    def _values_at(self, positions):
+        """
+        Collects the data at each of positions, finding the first Node once
+        and stepping along the bottom level from there
+
+        Args:
+            positions: A range of indexes with a positive step
+
+        Returns:
+            A python list of the data
+        """
+        values = []
+        if not positions:
+            return values
+
+        cur = self._find_before(positions[0])[0][0].next[0]
+        remaining = len(positions)
+        while True:
+            values.append(cur.data)
+            remaining -= 1
+            if remaining == 0:
+                return values
+            for num in range(positions.step):
+                cur = cur.next[0]
+
+    def write_to(self, fp, sep=' <-> ', limit=None):
+        """
+        Writes the same text as __str__ to fp in chunks instead of building it
+        as one string
+
+        Args:
+            fp: Any file-like object with a write method
+            sep: The string written between two values
+            limit: The most values to write, the rest are summarised as
+            '... (n more)' (optional)
+        """
+        _write_values(fp, iter(self), self._size, sep, limit)
+
+    def _random_height(self):
+        """
+        Picks how many levels a new Node is linked into, each extra level is
+        half as likely as the one below it
+
+        Returns:
+            The height of the new Node
+        """
+        height = 1
+        while height < self.MAX_LEVEL and random.random() < 0.5:
+            height += 1
+        return height
+
+    def _find_before(self, index):
+        """
+        Finds, on every level in use, the last Node that sits before index
+
+        Args:
+            index: The position we are looking in front of, 0 to size
+
+        Returns:
+            A tuple of the list of Nodes and the list of their positions, the
+            sentinel counts as position -1
+        """
+        chain = [None] * self._level
+        positions = [0] * self._level
+
+        node = self.sentinel
+        pos = -1
+        for level in range(self._level - 1, -1, -1):
+            # the link back to the sentinel always reaches past the last index
+            while pos + node.width[level] < index:
+                pos += node.width[level]
+                node = node.next[level]
+            chain[level] = node
+            positions[level] = pos
+
+        return chain, positions
+
+    def _insert(self, data, index):
+        """
+        Links a new Node holding data in at index
+
+        Args:
+            data: The data the new node will contain
+            index: The position of the new node, 0 to size
+        """
+        chain, positions = self._find_before(index)
+        height = self._random_height()
+
+        # bring any new levels into use, they start out as a single link from
+        # the sentinel back to itself across the whole list
+        if height > self._level:
+            for level in range(self._level, height):
+                self.sentinel.next[level] = self.sentinel
+                self.sentinel.width[level] = self._size + 1
+                chain.append(self.sentinel)
+                positions.append(-1)
+            self._level = height
+
+        new_link = SkipNode(height)  # initialize a new link
+        new_link.data = data  # set new_link data
+
+        # split the links that pass over index on the levels the Node is in
+        for level in range(height):
+            before = chain[level]
+            new_link.next[level] = before.next[level]
+            new_link.width[level] = \
+                positions[level] + before.width[level] + 1 - index
+            before.next[level] = new_link
+            before.width[level] = index - positions[level]
+
+        # the links above the new Node just got one position longer
+        for level in range(height, self._level):
+            chain[level].width[level] += 1
+
+        new_link.prev = chain[0]
+        new_link.next[0].prev = new_link
+        self._size += 1
+        self._modcount += 1
+
+    def _delete(self, index):
+        """
+        Unlinks the Node at index
+
+        Args:
+            index: The position of the node to remove, 0 to size - 1
+        """
+        chain, positions = self._find_before(index)
+        target = chain[0].next[0]
+        height = len(target.next)
+
+        # join the links on either side of the Node on the levels it is in
+        for level in range(height):
+            before = chain[level]
+            before.next[level] = target.next[level]
+            before.width[level] += target.width[level] - 1
+
+        # the links above the Node just got one position shorter
+        for level in range(height, self._level):
+            chain[level].width[level] -= 1
+
+        target.next[0].prev = chain[0]
+        self._size -= 1
+        self._modcount += 1
+
+    def get(self, index):
+        """
+        Returns the data in the element at index
+
+        Args:
+            index: The index of the element
+
+        Returns:
+            The data in the node at index
+        """
+        if index < 0 or index >= self._size:
+            raise Exception('Index out of range')
+
+        node = self.sentinel
+        pos = -1
+        for level in range(self._level - 1, -1, -1):
+            while pos + node.width[level] <= index:
+                pos += node.width[level]
+                node = node.next[level]
+        return node.data
+
+    def add_link_before(self, data, index):
+        """
+        Adds a new link containing data and inserts it before the link at index.
+        If index is 0, it inserts at the beginning of the list.
+
+        Args:
+            data: The data the new node will contain
+            index: The index of the node that will immediately follow the newly
+            added node
+        """
+
+        # handle an index out of range
+        if index < 0:
+            raise Exception('Index out of range')
+
+        # if the index is zero the new node is inserted at the beginning.
+        if index == 0:
+            self._insert(data, 0)
+            return True
+
+        if index >= self._size:
+            raise Exception('Index out of range')
+
+        self._insert(data, index)
+
+    def remove_link(self, index):
+        """
+        Removes the link at the location specified by index
+        Args:
+            index: The index of the node that will be removed
+        """
+        if self._size == 0:
+            return False
+
+        # handle an index out of range
+        if index < 0 or index >= self._size:
+            raise Exception('Index out of range')
+
+        self._delete(index)
+        return True
+
+    def add_front(self, data):
+        """
+        Adds a new node at the beginning of the list that contains data
+
+        Args:
+            data: The data the new node will contain
+        """
+        self._insert(data, 0)
+
+    def add_back(self, data):
+        """
+        Adds a new node at the end of the list that contains data
+
+        Args:
+            data: The data the new node will contain
+        """
+        self._insert(data, self._size)
+
+    def extend_back(self, iterable):
+        """
+        Adds the values of iterable to the end of the list in order
+
+        Args:
+            iterable: The values the new nodes will contain
+        """
+        for data in iterable:
+            self._insert(data, self._size)
+
+    def extend_front(self, iterable):
+        """
+        Adds the values of iterable to the beginning of the list, keeping their
+        order, so the first value of iterable becomes the front of the list
+
+        Args:
+            iterable: The values the new nodes will contain
+        """
+        for index, data in enumerate(iterable):
+            self._insert(data, index)
 
     def get_front(self):
         """
@@ -176,13 +3820,7 @@ class LinkedList:
         Returns:
             The data in the node at index 0 or None if there is no such node
         """
-
-        # if the list is empty return None
-        if self.head.next == self.tail:
-            return None
-
-        # otherwise we return the data of the first Node.
-        return self.head.next.data
+        return self.sentinel.next[0].data
 
     def get_back(self):
         """
@@ -193,53 +3831,27 @@ class LinkedList:
             The data in the node at last index of the list or None if there is
             no such node
         """
-
-        # if the list is empty returns None.
-        if self.head.next == self.tail:
-            return None
-
-        cur = self.head
-        prev = None
-
-        # flips through the list until the tail is reached and then returns the
-        # previous node
-        while cur != self.tail:
-            prev = cur
-            cur = cur.next
-
-        return prev.data
+        return self.sentinel.prev.data
 
     def remove_front(self):
         """
-        Removes the first element of the list. Will not remove the tail.
+        Removes the first element of the list.
         """
-
-        # if the list is empty nothing happens.
-        if self.head.next == self.tail:
+        if self._size == 0:
             return False
 
-        # change the next data members to point to skip the first Node
-        cur = self.head.next
-        self.head.next = cur.next
+        self._delete(0)
         return True
 
     def remove_back(self):
         """
-        Removes the last element of the list. Will not remove the head.
+        Removes the last element of the list.
         """
+        if self._size == 0:
+            return False
 
-        cur = self.head
-        prev = None
-
-        # since it's single link we need to go through the list to find the last
-        # Node which points to the end of the list. We then set the previous to
-        # skip the last Node.
-        while cur.next != self.tail:
-            prev = cur
-            cur = cur.next
-
-        prev.next = self.tail
-        return
+        self._delete(self._size - 1)
+        return True
 
     def is_empty(self):
         """
@@ -248,14 +3860,7 @@ class LinkedList:
         Returns:
             True if the list has no data nodes, False otherwise
         """
-
-        # returns true if the list is empty
-        if self.head.next == self.tail:
-            return True
-
-        # otherwise returns false
-        else:
-            return False
+        return self._size == 0
 
     def contains(self, value):
         """
@@ -267,19 +3872,12 @@ class LinkedList:
         Returns:
             True if value is in the list, False otherwise
         """
-
-        cur = self.head
-
-        # sort through the list checking the data of each Node, if found return
-        # True.
-        while cur != self.tail:
+        cur = self.sentinel.next[0]
+        while cur is not self.sentinel:
             if cur.data == value:
                 return True
-            cur = cur.next
-
-        # if the value is not found return False.
-        else:
-            return False
+            cur = cur.next[0]
+        return False
 
     def remove(self, value):
         """
@@ -289,203 +3887,212 @@ class LinkedList:
             value: the value to remove
         """
 
-        cur = self.head
-        prev = None
-
-        while cur != self.tail:
-
-            # check each Node to see if it contains our target value
+        # find the position of the value along the bottom level, then unlink
+        # it from every level it is in
+        cur = self.sentinel.next[0]
+        index = 0
+        while cur is not self.sentinel:
             if cur.data == value:
-                # if the value is found we change prev.next to point to skip the
-                # current Node.
-                prev.next = cur.next
-                return
-
-            prev = cur
-            cur = cur.next
+                self._delete(index)
+                return True
+            cur = cur.next[0]
+            index += 1
+        return False
 
-        return
+    def circularListReverse(self):
+        """
+        Reverses the order of the elements. It does not create any new links,
+        the data is swapped between Nodes working in from both ends so all of
+        the level widths stay valid.
+        """
+        self._modcount += 1
+        front = self.sentinel.next[0]
+        back = self.sentinel.prev
+        for number in range(self._size // 2):
+            front.data, back.data = back.data, front.data
+            front = front.next[0]
+            back = back.prev
 
 
 '''
 *******************************************************************************
-Part 2: 9898-465-7436 is the zoom meeting id 
+Part 5: Persistent Linked List, every change makes a new version that shares
+the rest of its Nodes with the old one
 *******************************************************************************
 '''
 
 
-class DLNode:
-    def __init__(self):
-        self.next = None
-        self.prev = None
-        self.data = None
+class PNode(tuple):
+    # an SLNode that can't be changed once made, which is what lets versions
+    # share their Nodes. Being a tuple also keeps it as small as an SLNode.
+    __slots__ = ()
 
+    def __new__(cls, data, next):
+        return tuple.__new__(cls, (data, next))
 
-class CircularList:
-    def __init__(self, start_list=None):
-        """
-        Initializes a linked list with a single sentinel node containing None
-        data
-        """
-        self.sentinel = DLNode()
-        self.sentinel.next = self.sentinel
-        self.sentinel.prev = self.sentinel
+    data = property(operator.itemgetter(0))
+    next = property(operator.itemgetter(1))
 
-        # populate list with initial set of nodes (if provided)
-        if start_list is not None:
-            for data in start_list:
-                self.add_back(data)
+    # comparing or printing a Node as a tuple would recurse down the whole
+    # chain, so Nodes compare by identity like SLNodes do
+    __eq__ = object.__eq__
+    __ne__ = object.__ne__
+    __hash__ = object.__hash__
+    __repr__ = object.__repr__
 
-    def __str__(self):
-        """
-        Returns a human readable string of the list content of the form
-        [value1 <-> value2 <-> value3]
 
-        An empty list should just print []
+class PersistentLinkedList:
+    # a version is only a reference to its first Node and its size
+    __slots__ = ('_head', '_size')
 
-        Returns:
-            The string of the human readable list representation
+    def __init__(self, start_list=None):
         """
-        out = '['
-        if self.sentinel.prev != self.sentinel:
-            cur = self.sentinel.next.next
-            out = out + str(self.sentinel.next.data)
-            while cur != self.sentinel:
-                out = out + ' <-> ' + str(cur.data)
-                cur = cur.next
-        out = out + ']'
-        return out
+        Initializes an immutable singly linked list. Persistent here means
+        persistent in the functional sense, not on disk like PersistentDeque:
+        add_front and remove_front leave this list as it is and return a new
+        version that shares all of its other Nodes with this one, so both
+        are constant time and every version stays valid.
 
-    def add_link_before(self, data, index):
-        """
-        Adds a new link containing data and inserts it before the link at index.
-        If index is 0, it inserts at the beginning of the list.
+        A version can be handed to any number of reader threads without a copy
+        or a lock, since nothing can change it.
 
         Args:
-            data: The data the new node will contain
-            index: The index of the node that will immediately follow the newly
-            added node
+            start_list: The values to populate the list with (optional)
         """
-        new_link = DLNode()  # initialize a new link
-        new_link.data = data  # set new_link data
+        head = None
+        size = 0
+        if start_list is not None:
+            # the Nodes are built from the back, each one pointing at the last
+            values = list(start_list)
+            for data in reversed(values):
+                head = PNode(data, head)
+            size = len(values)
+        self._head = head
+        self._size = size
+
+    @classmethod
+    def from_iterable(cls, iterable):
+        """
+        Builds a new list holding the values of iterable in order
 
-        # handle an index out of range
-        if index < 0:
-            raise Exception('Index out of range')
+        Args:
+            iterable: The values the new list will contain
 
-        # if the index is zero the new node is inserted at the beginning.
-        if index == 0:
-            new_link.prev = self.sentinel
-            new_link.next = self.sentinel.next
-            self.sentinel.next.prev = new_link
-            self.sentinel.next = new_link
-            return True
+        Returns:
+            The newly built list
+        """
+        return cls(iterable)
 
-        # if the index is anything else
-        cur = self.sentinel.next
-        for num in range(index):
-            cur = cur.next
-            if cur == self.sentinel:
-                # if the index is out of range we raise an exception
-                raise Exception('Index out of range')
+    @classmethod
+    def _version(cls, head, size):
+        """
+        Makes a version around an existing chain of Nodes without copying it
 
-        new_link.prev = cur.prev
-        cur.prev.next = new_link
-        new_link.next = cur
-        cur.prev = new_link
+        Args:
+            head: The first Node of the version, None for an empty list
+            size: The number of Nodes in the chain
 
-    def remove_link(self, index):
+        Returns:
+            The new version
         """
-        Removes the link at the location specified by index
-        Args:
-            index: The index of the node that will be removed
+        version = cls.__new__(cls)
+        version._head = head
+        version._size = size
+        return version
+
+    def __str__(self):
         """
-        if self.sentinel.next == self.sentinel:
-            return False
+        Returns a human readable string of the list content of the form
+        [value1 -> value2 -> value3]
 
-        # handle an index out of range
-        if index < 0:
-            raise Exception('Index out of range')
+        An empty list should just print []
 
-        cur = self.sentinel.next
-        for num in range(index):
-            cur = cur.next
-            if cur == self.sentinel:
-                raise Exception('Index out of range')
+        Returns:
+            The string of the human readable list representation
+        """
+        return '[' + ' -> '.join([str(data) for data in self]) + ']'
 
-        # if the Node we are removing is not linked to the sentinel
-        if cur.prev != self.sentinel and cur.next != self.sentinel:
-            cur.next.prev = cur.prev
-            cur.prev.next = cur.next
+    def __len__(self):
+        """
+        Returns the number of data nodes in the list
 
-        # if the Node we are removing is in the front of the DL list
-        if cur.prev == self.sentinel and cur.next != self.sentinel:
-            cur.next.prev = self.sentinel
-            self.sentinel.next = cur.next
+        Returns:
+            The number of elements in the list
+        """
+        return self._size
 
-        # if the Node we are removing is in the back of the DL list
-        if cur.prev != self.sentinel and cur.next == self.sentinel:
-            cur.prev.next = self.sentinel
-            self.sentinel.prev = cur.prev
+    def __iter__(self):
+        """
+        Walks the list from front to back. The version can't change, so unlike
+        the other lists nothing can go wrong during the walk.
 
-        # if the list contains only one Node in it
-        if cur.prev == self.sentinel and cur.next == self.sentinel:
-            self.sentinel.prev = self.sentinel
-            self.sentinel.next = self.sentinel
+        Returns:
+            A generator over the data of each Node
+        """
+        # a PNode is a (data, next) tuple, unpacking it is quicker than going
+        # through the two properties
+        cur = self._head
+        while cur is not None:
+            data, cur = cur
+            yield data
+
+    def __reduce__(self):
+        """
+        Pickles the version as its values in a flat python list instead of a
+        chain of Nodes, which would recurse once per Node. Sharing with other
+        versions doesn't survive the trip.
 
-        return True
+        Returns:
+            The class and the constructor arguments that rebuild the list
+        """
+        return self.__class__, (list(self),)
 
-    def add_front(self, data):
+    def write_to(self, fp, sep=' -> ', limit=None):
         """
-        Adds a new node at the beginning of the list that contains data
+        Writes the same text as __str__ to fp in chunks instead of building it
+        as one string
 
         Args:
-            data: The data the new node will contain
+            fp: Any file-like object with a write method
+            sep: The string written between two values
+            limit: The most values to write, the rest are summarised as
+            '... (n more)' (optional)
         """
-        new_link = DLNode()  # initialize a new link
-        new_link.data = data  # set new_link data
-
-        # if the list is empty we set both next and prev on the sentinel
-        if self.sentinel.prev == self.sentinel:
-            new_link.prev = self.sentinel
-            new_link.next = self.sentinel.next
-            self.sentinel.prev = new_link
-            self.sentinel.next = new_link
+        _write_values(fp, iter(self), self._size, sep, limit)
 
-        # if the list isn't empty we just set next on the sentinel
-        else:
-            new_link.prev = self.sentinel
-            new_link.next = self.sentinel.next
-            self.sentinel.next.prev = new_link
-            self.sentinel.next = new_link
+    def snapshot(self):
+        """
+        Returns a version to hand to a reader. Versions never change, so this
+        is the version itself.
 
-        return
+        Returns:
+            This list
+        """
+        return self
 
-    def add_back(self, data):
+    def add_front(self, data):
         """
-        Adds a new node at the end of the list that contains data
+        Makes a new version with a Node holding data in front of this one
 
         Args:
             data: The data the new node will contain
-        """
-        new_link = DLNode()  # initialize a new link
-        new_link.data = data  # set new_link data
 
-        # if the list is empty we set both next and prev on the sentinel
-        if self.sentinel.prev == self.sentinel:
-            new_link.prev = self.sentinel
-            new_link.next = self.sentinel.next
-            self.sentinel.prev = new_link
-            self.sentinel.next = new_link
+        Returns:
+            The new version, this one is unchanged
+        """
+        return self._version(PNode(data, self._head), self._size + 1)
 
-        # if the list isn't empty we just set next on the sentinel
-        else:
-            new_link.prev = self.sentinel.prev
-            new_link.next = self.sentinel
-            self.sentinel.prev.next = new_link
-            self.sentinel.prev = new_link
+    def remove_front(self):
+        """
+        Makes a new version without the first value of this one. An empty list
+        has nothing to remove and is returned as it is.
 
-        return
+        Returns:
+            The new version, this one is unchanged
+        """
+        if self._head is None:
+            return self
+        return self._version(self._head.next, self._size - 1)
 
     def get_front(self):
         """
@@ -495,46 +4102,25 @@ class CircularList:
         Returns:
             The data in the node at index 0 or None if there is no such node
         """
-
-        return self.sentinel.next.data
+        if self._head is None:
+            return None
+        return self._head.data
 
     def get_back(self):
         """
         Returns the data in the element at the end of the list. Will return
-        None in an empty list.
+        None in an empty list. Versions don't keep track of their last Node,
+        which may be shared, so this walks the list.
 
         Returns:
             The data in the node at last index of the list or None if there is
             no such node
         """
-
-        return self.sentinel.prev.data
-
-    def remove_front(self):
-        """
-        Removes the first element of the list. Will not remove the tail.
-        """
-
-        if self.sentinel.next == self.sentinel:
-            return False
-        else:
-            self.sentinel.next.next.prev = self.sentinel
-            self.sentinel.next = self.sentinel.next.next
-
-            return True
-
-    def remove_back(self):
-        """
-        Removes the last element of the list. Will not remove the head.
-        """
-
-        if self.sentinel.prev == self.sentinel:
-            return False
-        else:
-            self.sentinel.prev.prev.next = self.sentinel
-            self.sentinel.prev = self.sentinel.prev.prev
-
-            return True
+        data = None
+        cur = self._head
+        while cur is not None:
+            data, cur = cur
+        return data
 
     def is_empty(self):
         """
@@ -543,11 +4129,7 @@ class CircularList:
         Returns:
             True if the list has no data nodes, False otherwise
         """
-
-        if self.sentinel.next == self.sentinel:
-            return True
-        else:
-            return False
+        return self._head is None
 
     def contains(self, value):
         """
@@ -559,71 +4141,9 @@ class CircularList:
         Returns:
             True if value is in the list, False otherwise
         """
-
-        if self.sentinel.next == self.sentinel:
-            return False
-        else:
-            cur = self.sentinel.next
-            while cur != self.sentinel:
-                if cur.data == value:
-                    return True
-                cur = cur.next
-
-            return False
-
-    def remove(self, value):
-        """
-        Removes the first instance of an element from the list
-
-        Args:
-            value: the value to remove
-        """
-
-        cur = self.sentinel.next
-        while cur != self.sentinel:
-            if cur.data == value:
-
-                # handles a non-end value
-                if cur.prev != self.sentinel and cur.next != self.sentinel:
-                    cur.next.prev = cur.prev
-                    cur.prev.next = cur.next
-
-                # handles a value at the front of the list
-                if cur.prev == self.sentinel and cur.next != self.sentinel:
-                    self.sentinel.next = cur.next
-                    cur.next.prev = self.sentinel
-
-                # handles a value at the end of the list
-                if cur.prev != self.sentinel and cur.next == self.sentinel:
-                    self.sentinel.prev = cur.prev
-                    cur.prev.next = self.sentinel
-
+        cur = self._head
+        while cur is not None:
+            data, cur = cur
+            if data == value:
                 return True
-
-            cur = cur.next
         return False
-
-    def circularListReverse(self):
-        """
-        Reverses the order of the links. It must not create any additional new
-        links to do so. (e.g. you cannot call DLNode()). If the list printed by
-        following next was 0, 1, 2, 3, after the call it will be 3,2,1,0
-        """
-
-        # set a base case where we are looking at the 1st and 2nd node
-        cur = self.sentinel.next
-        next_node = cur.next
-
-        # takes a Node and flips their prev and next values
-        while cur != self.sentinel:
-            cur.next = cur.prev
-            cur.prev = next_node
-            cur = next_node
-            next_node = cur.next
-
-        # since hitting the sentinel is what stops the loop we have to
-        # manually set the prev and next values for sentinel to close the loop
-        hold_me = cur.prev
-        cur.prev = cur.next
-        cur.next = hold_me
-        return
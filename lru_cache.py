@@ -0,0 +1,204 @@
+# lru_cache.py
+# ===================================================
+# Least recently used cache built on CircularList
+# ===================================================
+
+import functools
+
+from linked_list import CircularList
+
+# stands in for "not cached" so None can be cached like any other value
+_MISSING = object()
+
+# separates positional from keyword arguments in a memoize key
+_KWARGS_MARK = object()
+
+
+class LRUCache:
+    def __init__(self, capacity=128):
+        """
+        Initializes a cache that holds at most capacity keys and, once full,
+        evicts the key used least recently. A dictionary maps each key to the
+        handle of its Node in a bounded CircularList kept in order of use, so
+        gets, puts and evictions are all constant time.
+
+        Like the lists it is built on it is not thread safe, share one between
+        threads behind a lock.
+
+        Args:
+            capacity: The most keys the cache holds
+        """
+        if capacity < 1:
+            raise Exception('Capacity must be at least 1')
+
+        self.capacity = capacity
+
+        # key -> (Node handle, value), the Node itself only holds the key
+        self._map = {}
+
+        # most recently used key at the front. When full, adding at the front
+        # evicts the back key.
+        self._order = CircularList(maxlen=capacity, on_evict=self._evicted)
+
+        # counters for stats()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        """
+        Returns the number of keys in the cache
+
+        Returns:
+            The number of cached keys
+        """
+        return len(self._map)
+
+    def __contains__(self, key):
+        """
+        Checks if key is cached, without counting as a use of it
+
+        Args:
+            key: The key to look for
+
+        Returns:
+            True if key is cached, False otherwise
+        """
+        return key in self._map
+
+    def __iter__(self):
+        """
+        Walks the keys from most to least recently used
+
+        Returns:
+            A generator over the keys
+        """
+        return iter(self._order)
+
+    def _evicted(self, key):
+        """
+        Drops the entry of a key the CircularList just evicted from its back
+
+        Args:
+            key: The least recently used key
+        """
+        del self._map[key]
+        self.evictions += 1
+
+    def get(self, key, default=None):
+        """
+        Returns the value cached for key and marks key as the most recently
+        used
+
+        Args:
+            key: The key to look up
+            default: What to return if key isn't cached
+
+        Returns:
+            The cached value, or default
+        """
+        entry = self._map.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        self._order.move_to_front(entry[0])
+        return entry[1]
+
+    def put(self, key, value):
+        """
+        Caches value for key and marks key as the most recently used. If the
+        cache is full the least recently used key is evicted.
+
+        Args:
+            key: The key, must be hashable
+            value: The value to cache
+        """
+        entry = self._map.get(key)
+        if entry is not None:
+            self._order.move_to_front(entry[0])
+            self._map[key] = (entry[0], value)
+            return
+
+        node = self._order.add_front(key, handle=True)
+        self._map[key] = (node, value)
+
+    def pop(self, key, default=None):
+        """
+        Removes key from the cache
+
+        Args:
+            key: The key to remove
+            default: What to return if key isn't cached
+
+        Returns:
+            The value that was cached for key, or default
+        """
+        entry = self._map.pop(key, None)
+        if entry is None:
+            return default
+
+        self._order.remove_node(entry[0])
+        return entry[1]
+
+    def clear(self):
+        """
+        Removes every key, the counters are kept
+        """
+        self._map = {}
+        self._order = CircularList(maxlen=self.capacity,
+                                   on_evict=self._evicted)
+
+    def stats(self):
+        """
+        Returns a snapshot of the cache counters
+
+        Returns:
+            A dictionary of the hits, misses, evictions, the current number of
+            keys and the capacity
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self._map),
+            'capacity': self.capacity,
+        }
+
+
+def memoize(capacity=128):
+    """
+    Decorator that caches a function's results in an LRUCache, keyed by its
+    arguments, which must be hashable. The cache is available as the cache
+    attribute of the decorated function.
+
+        @memoize(capacity=1024)
+        def lookup(user_id):
+            ...
+
+    Args:
+        capacity: The most results to keep
+
+    Returns:
+        The decorator
+    """
+    def decorator(function):
+        cache = LRUCache(capacity)
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            key = args
+            if kwargs:
+                key = args + (_KWARGS_MARK,) + tuple(sorted(kwargs.items()))
+
+            result = cache.get(key, _MISSING)
+            if result is _MISSING:
+                result = function(*args, **kwargs)
+                cache.put(key, result)
+            return result
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
@@ -0,0 +1,429 @@
+# numeric_list.py
+# ===================================================
+# Typed numeric deque backed by a NumPy ring buffer
+# ===================================================
+
+import numpy as np
+
+
+class NumericDeque:
+    def __init__(self, start_list=None, dtype=np.float64, capacity=16):
+        """
+        Initializes a deque of numbers stored in a growable NumPy ring buffer
+        instead of one DLNode per value. It has the same methods as
+        CircularList, and scans like contains and count run inside NumPy.
+
+        Values are converted to dtype as they are added, so adding 2.5 to an
+        integer deque stores 2.
+
+        Args:
+            start_list: The values to populate the deque with (optional)
+            dtype: The NumPy dtype of the values
+            capacity: The number of values to make room for up front
+        """
+        self.dtype = np.dtype(dtype)
+        self._buf = np.empty(max(capacity, 1), dtype=self.dtype)
+        self._head = 0  # the position of the first value in _buf
+        self._size = 0
+        self._modcount = 0  # bumped on every change, for iterators
+
+        # populate deque with initial set of values (if provided)
+        if start_list is not None:
+            self.extend_back(start_list)
+
+    @classmethod
+    def from_iterable(cls, iterable, **options):
+        """
+        Builds a new deque holding the values of iterable in order
+
+        Args:
+            iterable: The values the new deque will contain
+            options: Passed on to the constructor (dtype, capacity)
+
+        Returns:
+            The newly built deque
+        """
+        new_deque = cls(**options)
+        new_deque.extend_back(iterable)
+        return new_deque
+
+    def __len__(self):
+        """
+        Returns the number of values in the deque
+
+        Returns:
+            The number of elements in the deque
+        """
+        return self._size
+
+    def __iter__(self):
+        """
+        Walks the deque from front to back, converting a chunk of values at a
+        time. Changing the deque while the walk is going on raises an exception
+        on the next step.
+
+        Returns:
+            A generator over the values as python numbers
+        """
+        return self._walk(self._modcount)
+
+    def _walk(self, modcount):
+        """
+        Walks the values from front to back. The modcount is taken when the
+        walk is asked for, so a change before the first step is caught too.
+
+        Args:
+            modcount: The modcount the deque must keep for the walk to go on
+
+        Returns:
+            A generator over the values as python numbers
+        """
+        if self._modcount != modcount:
+            raise Exception('List modified during iteration')
+        for segment in self.segments():
+            for start in range(0, len(segment), 4096):
+                for data in segment[start:start + 4096].tolist():
+                    yield data
+                    if self._modcount != modcount:
+                        raise Exception('List modified during iteration')
+
+    def __str__(self):
+        """
+        Returns a human readable string of the deque content of the form
+        [value1 <-> value2 <-> value3]
+
+        Returns:
+            The string of the human readable deque representation
+        """
+        return '[' + ' <-> '.join([str(data) for data in self]) + ']'
+
+    def __getitem__(self, index):
+        """
+        Returns the value at index, negative indexes count back from the end
+
+        Args:
+            index: The index of the value
+
+        Returns:
+            The value at index as a python number
+        """
+        if index < 0:
+            index += self._size
+        if index < 0 or index >= self._size:
+            raise Exception('Index out of range')
+        return self._buf[(self._head + index) % len(self._buf)].item()
+
+    # ----- buffer handling -----
+
+    def segments(self):
+        """
+        Returns views of the values without copying them. The values are in
+        one piece unless they wrap around the end of the ring buffer.
+
+        Returns:
+            A tuple of one or two NumPy views, in order
+        """
+        end = self._head + self._size
+        if end <= len(self._buf):
+            return (self._buf[self._head:end],)
+        return (self._buf[self._head:],
+                self._buf[:end - len(self._buf)])
+
+    def _compact(self, capacity=None):
+        """
+        Moves the values to the start of a buffer so they are in one piece
+
+        Args:
+            capacity: The size of the new buffer, defaults to the current size
+        """
+        if capacity is None:
+            capacity = len(self._buf)
+        buf = np.empty(capacity, dtype=self.dtype)
+        pos = 0
+        for segment in self.segments():
+            buf[pos:pos + len(segment)] = segment
+            pos += len(segment)
+        self._buf = buf
+        self._head = 0
+
+    def _reserve(self, extra):
+        """
+        Makes sure there is room for extra more values, doubling the buffer
+        until there is
+
+        Args:
+            extra: The number of values about to be added
+        """
+        needed = self._size + extra
+        if needed <= len(self._buf):
+            return
+        capacity = len(self._buf)
+        while capacity < needed:
+            capacity *= 2
+        self._compact(capacity)
+
+    def as_array(self):
+        """
+        Returns a view of all the values without copying them. If the values
+        wrap around the end of the ring buffer they are first moved into one
+        piece, after that the view is free until they wrap again.
+
+        Returns:
+            A NumPy view of the values, in order
+        """
+        if len(self.segments()) > 1:
+            self._compact()
+        return self._buf[self._head:self._head + self._size]
+
+    # ----- deque interface -----
+
+    def add_front(self, data):
+        """
+        Adds a value at the beginning of the deque
+
+        Args:
+            data: The value to add
+        """
+        self._reserve(1)
+        self._head = (self._head - 1) % len(self._buf)
+        self._buf[self._head] = data
+        self._size += 1
+        self._modcount += 1
+
+    def add_back(self, data):
+        """
+        Adds a value at the end of the deque
+
+        Args:
+            data: The value to add
+        """
+        self._reserve(1)
+        self._buf[(self._head + self._size) % len(self._buf)] = data
+        self._size += 1
+        self._modcount += 1
+
+    def extend_back(self, iterable):
+        """
+        Adds the values of iterable to the end of the deque in order, copying
+        them in with at most two slice assignments
+
+        Args:
+            iterable: The values to add, an array is used without conversion
+        """
+        values = self._as_values(iterable)
+        count = len(values)
+        if count == 0:
+            return
+
+        self._reserve(count)
+        start = (self._head + self._size) % len(self._buf)
+        first = min(count, len(self._buf) - start)
+        self._buf[start:start + first] = values[:first]
+        self._buf[:count - first] = values[first:]
+        self._size += count
+        self._modcount += 1
+
+    def extend_front(self, iterable):
+        """
+        Adds the values of iterable to the beginning of the deque, keeping
+        their order, so the first value of iterable becomes the front
+
+        Args:
+            iterable: The values to add, an array is used without conversion
+        """
+        values = self._as_values(iterable)
+        count = len(values)
+        if count == 0:
+            return
+
+        self._reserve(count)
+        start = (self._head - count) % len(self._buf)
+        first = min(count, len(self._buf) - start)
+        self._buf[start:start + first] = values[:first]
+        self._buf[:count - first] = values[first:]
+        self._head = start
+        self._size += count
+        self._modcount += 1
+
+    def _as_values(self, iterable):
+        """
+        Turns iterable into a NumPy array of the deque's dtype
+
+        Args:
+            iterable: An array, a sequence or any other iterable of numbers
+
+        Returns:
+            A NumPy array
+        """
+        if isinstance(iterable, (np.ndarray, list, tuple, range)):
+            return np.asarray(iterable, dtype=self.dtype)
+        return np.fromiter(iterable, dtype=self.dtype)
+
+    def add_link_before(self, data, index):
+        """
+        Adds a new value and inserts it before the value at index. If index is
+        0, it inserts at the beginning of the deque.
+
+        Args:
+            data: The value to add
+            index: The index of the value that will immediately follow the
+            newly added value
+        """
+
+        # handle an index out of range
+        if index < 0:
+            raise Exception('Index out of range')
+
+        # if the index is zero the new value is inserted at the beginning.
+        if index == 0:
+            self.add_front(data)
+            return True
+
+        if index >= self._size:
+            raise Exception('Index out of range')
+
+        # get the values into one piece with room after them, then shift
+        # everything from index on along by one in a single move
+        self._reserve(1)
+        if self._head + self._size >= len(self._buf):
+            self._compact()
+        start = self._head + index
+        end = self._head + self._size
+        self._buf[start + 1:end + 1] = self._buf[start:end]
+        self._buf[start] = data
+        self._size += 1
+        self._modcount += 1
+
+    def remove_link(self, index):
+        """
+        Removes the value at the location specified by index
+        Args:
+            index: The index of the value that will be removed
+        """
+        if self._size == 0:
+            return False
+
+        # handle an index out of range
+        if index < 0 or index >= self._size:
+            raise Exception('Index out of range')
+
+        # shift everything after index back by one in a single move
+        values = self.as_array()
+        values[index:-1] = values[index + 1:]
+        self._size -= 1
+        self._modcount += 1
+        return True
+
+    def get_front(self):
+        """
+        Returns the value at the front of the deque. Will return None in an
+        empty deque.
+
+        Returns:
+            The value at index 0 or None if there is no such value
+        """
+        if self._size == 0:
+            return None
+        return self._buf[self._head].item()
+
+    def get_back(self):
+        """
+        Returns the value at the end of the deque. Will return None in an empty
+        deque.
+
+        Returns:
+            The value at the last index or None if there is no such value
+        """
+        if self._size == 0:
+            return None
+        return self._buf[(self._head + self._size - 1) % len(self._buf)].item()
+
+    def remove_front(self):
+        """
+        Removes the first value of the deque.
+        """
+        if self._size == 0:
+            return False
+        self._head = (self._head + 1) % len(self._buf)
+        self._size -= 1
+        self._modcount += 1
+        return True
+
+    def remove_back(self):
+        """
+        Removes the last value of the deque.
+        """
+        if self._size == 0:
+            return False
+        self._size -= 1
+        self._modcount += 1
+        return True
+
+    def is_empty(self):
+        """
+        Checks if the deque is empty
+
+        Returns:
+            True if the deque has no values, False otherwise
+        """
+        return self._size == 0
+
+    def contains(self, value):
+        """
+        Checks if any value equals value, comparing whole segments at once
+
+        Args:
+            value: The value to look for
+
+        Returns:
+            True if value is in the deque, False otherwise
+        """
+
+        # an array or list would broadcast against the segments, but a deque
+        # only ever holds scalars so it can't contain one
+        if np.ndim(value) != 0:
+            return False
+        for segment in self.segments():
+            if (segment == value).any():
+                return True
+        return False
+
+    def count(self, value):
+        """
+        Counts the values equal to value, comparing whole segments at once
+
+        Args:
+            value: The value to count
+
+        Returns:
+            The number of matching values
+        """
+        if np.ndim(value) != 0:
+            return 0
+        return sum(int(np.count_nonzero(segment == value))
+                   for segment in self.segments())
+
+    def remove(self, value):
+        """
+        Removes the first instance of a value from the deque
+
+        Args:
+            value: the value to remove
+        """
+        if np.ndim(value) != 0:
+            return False
+        offset = 0
+        for segment in self.segments():
+            matches = np.flatnonzero(segment == value)
+            if len(matches):
+                return self.remove_link(offset + int(matches[0]))
+            offset += len(segment)
+        return False
+
+    def circularListReverse(self):
+        """
+        Reverses the order of the values in place
+        """
+        values = self.as_array()
+        values[:] = values[::-1].copy()
+        self._modcount += 1
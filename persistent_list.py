@@ -0,0 +1,588 @@
+# persistent_list.py
+# ===================================================
+# Disk-spilling persistent deque built on CircularList
+# ===================================================
+
+import mmap
+import os
+import pickle
+import struct
+import zlib
+
+from linked_list import CircularList
+
+
+# the header is kept twice in page 0 and written to the two slots in turn, so
+# a crash half way through writing one still leaves the other one intact.
+# magic, page size, sequence number, first manifest page, number of data
+# pages, number of values, crc32 of everything before it
+_HEADER = struct.Struct('<4sIQqqqI')
+_HEADER_SLOTS = (0, 64)
+_MAGIC = b'PDQ1'
+
+# a data page holds a count followed by length prefixed pickled values
+_DATA_HEADER = struct.Struct('<I')
+_RECORD = struct.Struct('<I')
+
+# a manifest page holds the next manifest page, a count and then page numbers
+_MANIFEST_HEADER = struct.Struct('<qI')
+_PAGE_NUMBER = struct.Struct('<q')
+
+
+def _records_size(blobs):
+    """
+    Works out how many bytes encoded values take up in a data page
+
+    Args:
+        blobs: The encoded values
+
+    Returns:
+        The number of bytes, length prefixes included
+    """
+    return sum(_RECORD.size + len(blob) for blob in blobs)
+
+
+class _HotSegment:
+    def __init__(self):
+        """
+        Initializes an in memory run of encoded values at one end of the deque
+        """
+        self.blobs = CircularList()
+        self.nbytes = 0  # the bytes the blobs would take up in a data page
+
+
+class PersistentDeque:
+    def __init__(self, path, page_size=65536):
+        """
+        Opens (or creates) a deque stored in the file at path. The values near
+        both ends are kept in memory and everything in between is spilled to
+        fixed size pages of a memory mapped file, one whole page at a time.
+
+        Changes are made durable by flush() or close(). If the process dies in
+        between, reopening the file gives back the deque as it was at the last
+        flush.
+
+        Args:
+            path: The file holding the deque
+            page_size: The size of a page in bytes, only used when the file is
+            created
+        """
+        if page_size < 4096:
+            raise Exception('Page size must be at least 4096 bytes')
+
+        self.path = path
+        self._file = open(path, 'r+b' if os.path.exists(path) else 'w+b')
+        self._map = None
+
+        self._front = _HotSegment()
+        self._back = _HotSegment()
+
+        # the data pages between the two hot segments, in order
+        self._pages = CircularList()
+
+        # pages that can be written to. Pages given up since the last flush
+        # wait in _released, the last flushed state may still point at them.
+        self._free = []
+        self._released = []
+        self._manifest_pages = []
+
+        if os.fstat(self._file.fileno()).st_size == 0:
+            self.page_size = page_size
+            self._seq = 0
+            self._length = 0
+            self._page_count = 1
+            self._resize(page_size)
+            self._write_header()
+        else:
+            self._map = mmap.mmap(self._file.fileno(), 0)
+            self._load()
+
+    def __enter__(self):
+        """
+        Returns:
+            The deque itself, so it can be used in a with statement
+        """
+        return self
+
+    def __exit__(self, *exc_info):
+        """
+        Closes the deque at the end of a with statement
+        """
+        self.close()
+
+    def __len__(self):
+        """
+        Returns the number of values in the deque
+
+        Returns:
+            The number of elements in the deque
+        """
+        return self._length
+
+    def __iter__(self):
+        """
+        Walks the deque from front to back, reading spilled pages as it goes
+
+        Returns:
+            A generator over the values of the deque
+        """
+        for blob in self._front.blobs:
+            yield pickle.loads(blob)
+        for page in self._pages:
+            for blob in self._read_data_page(page):
+                yield pickle.loads(blob)
+        for blob in self._back.blobs:
+            yield pickle.loads(blob)
+
+    def __str__(self):
+        """
+        Returns a human readable string of the deque content of the form
+        [value1 <-> value2 <-> value3]
+
+        Returns:
+            The string of the human readable deque representation
+        """
+        return '[' + ' <-> '.join([str(data) for data in self]) + ']'
+
+    @property
+    def _payload_size(self):
+        """
+        Returns:
+            The number of bytes of values a single data page can hold
+        """
+        return self.page_size - _DATA_HEADER.size
+
+    # ----- file and page handling -----
+
+    def _resize(self, size):
+        """
+        Grows the file to size bytes and maps it again
+
+        Args:
+            size: The new size of the file in bytes
+        """
+        if self._map is not None:
+            self._map.close()
+        self._file.truncate(size)
+        self._map = mmap.mmap(self._file.fileno(), size)
+
+    def _allocate_page(self):
+        """
+        Picks a page to write to, growing the file if there are no free pages
+
+        Returns:
+            The page number
+        """
+        if self._free:
+            return self._free.pop()
+
+        page = self._page_count
+        self._page_count += 1
+
+        # the file doubles in size so growing it doesn't happen too often
+        if self._page_count * self.page_size > len(self._map):
+            self._resize(max(len(self._map) * 2,
+                             self._page_count * self.page_size))
+        return page
+
+    def _write_data_page(self, blobs):
+        """
+        Writes encoded values to a fresh page in a single write
+
+        Args:
+            blobs: The encoded values, in order
+
+        Returns:
+            The page number
+        """
+        page = self._allocate_page()
+        parts = [_DATA_HEADER.pack(len(blobs))]
+        for blob in blobs:
+            parts.append(_RECORD.pack(len(blob)))
+            parts.append(blob)
+        buf = b''.join(parts)
+
+        offset = page * self.page_size
+        self._map[offset:offset + len(buf)] = buf
+        return page
+
+    def _read_data_page(self, page):
+        """
+        Reads the encoded values held in a page
+
+        Args:
+            page: The page number
+
+        Returns:
+            A python list of the encoded values, in order
+        """
+        offset = page * self.page_size
+        count, = _DATA_HEADER.unpack_from(self._map, offset)
+        pos = offset + _DATA_HEADER.size
+
+        blobs = []
+        for number in range(count):
+            length, = _RECORD.unpack_from(self._map, pos)
+            pos += _RECORD.size
+            blobs.append(self._map[pos:pos + length])
+            pos += length
+        return blobs
+
+    def _write_header(self):
+        """
+        Commits the manifest and counts to the header slot that wasn't used
+        last time
+        """
+        self._seq += 1
+        manifest = self._manifest_pages[0] if self._manifest_pages else -1
+        fields = (_MAGIC, self.page_size, self._seq, manifest,
+                  len(self._pages), self._length)
+        packed = _HEADER.pack(*fields, 0)
+        crc = zlib.crc32(packed[:-4])
+        _HEADER.pack_into(self._map, _HEADER_SLOTS[self._seq % 2],
+                          *fields, crc)
+
+    def _load(self):
+        """
+        Reads the newest intact header of an existing file along with its
+        manifest, and works out which pages are free
+        """
+        best = None
+        for slot in _HEADER_SLOTS:
+            fields = _HEADER.unpack_from(self._map, slot)
+            packed = _HEADER.pack(*fields[:-1], 0)
+            if fields[0] != _MAGIC or zlib.crc32(packed[:-4]) != fields[-1]:
+                continue
+            if best is None or fields[2] > best[2]:
+                best = fields
+
+        if best is None:
+            raise Exception('Not a persistent deque file: %s' % self.path)
+
+        magic, self.page_size, self._seq, manifest, page_total, \
+            self._length, crc = best
+        self._page_count = len(self._map) // self.page_size
+
+        # follow the manifest to rebuild the page order
+        used = {0}
+        while manifest != -1:
+            self._manifest_pages.append(manifest)
+            used.add(manifest)
+            offset = manifest * self.page_size
+            manifest, count = _MANIFEST_HEADER.unpack_from(self._map, offset)
+            offset += _MANIFEST_HEADER.size
+            for number in range(count):
+                page, = _PAGE_NUMBER.unpack_from(self._map, offset)
+                offset += _PAGE_NUMBER.size
+                self._pages.add_back(page)
+                used.add(page)
+
+        if len(self._pages) != page_total:
+            raise Exception('Manifest does not match the header: %s'
+                            % self.path)
+
+        self._free = [page for page in range(self._page_count - 1, 0, -1)
+                      if page not in used]
+
+    # ----- moving values between memory and pages -----
+
+    def _take_page_of(self, segment, from_front):
+        """
+        Removes one page worth of encoded values from an end of a segment
+
+        Args:
+            segment: The hot segment to take from
+            from_front: True to take from the front of the segment
+
+        Returns:
+            A python list of the encoded values, in list order
+        """
+        blobs = []
+        used = 0
+        while not segment.blobs.is_empty():
+            if from_front:
+                blob = segment.blobs.get_front()
+            else:
+                blob = segment.blobs.get_back()
+            size = _RECORD.size + len(blob)
+            if used + size > self._payload_size:
+                break
+
+            if from_front:
+                segment.blobs.remove_front()
+            else:
+                segment.blobs.remove_back()
+            blobs.append(blob)
+            used += size
+            segment.nbytes -= size
+
+        if not from_front:
+            blobs.reverse()
+        return blobs
+
+    def _spill(self, segment):
+        """
+        Writes the inner page worth of a hot segment out to a page, the inner
+        end of the front segment is its back and the other way around. If the
+        values and the neighbouring page fit in one page together, they are
+        written out as one.
+
+        Args:
+            segment: The hot segment that has grown too big, or is being
+            flushed
+        """
+        at_front = segment is self._front
+        blobs = self._take_page_of(segment, not at_front)
+
+        # flush() spills whatever is in the hot segments, often only a few
+        # values. Merging them into the neighbouring page keeps repeated
+        # flushes from leaving a trail of nearly empty pages. Pages are never
+        # written over, so the merged page is a fresh one and the neighbour is
+        # released like a page that was read back in.
+        if not self._pages.is_empty():
+            if at_front:
+                neighbour = self._pages.get_front()
+            else:
+                neighbour = self._pages.get_back()
+            old = self._read_data_page(neighbour)
+            if _records_size(old) + _records_size(blobs) <= \
+                    self._payload_size:
+                if at_front:
+                    self._pages.remove_front()
+                    blobs = blobs + old
+                else:
+                    self._pages.remove_back()
+                    blobs = old + blobs
+                self._release_page(neighbour)
+
+        if at_front:
+            self._pages.add_front(self._write_data_page(blobs))
+        else:
+            self._pages.add_back(self._write_data_page(blobs))
+
+    def _release_page(self, page):
+        """
+        Gives up a page that has been read back into memory
+
+        Args:
+            page: The page number
+        """
+        self._released.append(page)
+
+    def _front_segment(self):
+        """
+        Finds the hot segment holding the first value, reading the first page
+        back in if the front segment has run dry
+
+        Returns:
+            The hot segment to take the first value from
+        """
+        if self._front.blobs.is_empty():
+            if self._pages.is_empty():
+                return self._back
+            page = self._pages.get_front()
+            self._pages.remove_front()
+            blobs = self._read_data_page(page)
+            self._front.blobs.extend_back(blobs)
+            self._front.nbytes = _records_size(blobs)
+            self._release_page(page)
+        return self._front
+
+    def _back_segment(self):
+        """
+        Finds the hot segment holding the last value, reading the last page
+        back in if the back segment has run dry
+
+        Returns:
+            The hot segment to take the last value from
+        """
+        if self._back.blobs.is_empty():
+            if self._pages.is_empty():
+                return self._front
+            page = self._pages.get_back()
+            self._pages.remove_back()
+            blobs = self._read_data_page(page)
+            self._back.blobs.extend_back(blobs)
+            self._back.nbytes = _records_size(blobs)
+            self._release_page(page)
+        return self._back
+
+    def _encode(self, data):
+        """
+        Pickles data and checks it fits in a page
+
+        Args:
+            data: The value to encode
+
+        Returns:
+            The encoded value
+        """
+        blob = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+        if _RECORD.size + len(blob) > self._payload_size:
+            raise Exception('Value is too large for a page')
+        return blob
+
+    # ----- deque interface -----
+
+    def add_front(self, data):
+        """
+        Adds a value at the beginning of the deque
+
+        Args:
+            data: The value to add
+        """
+        blob = self._encode(data)
+        self._front.blobs.add_front(blob)
+        self._front.nbytes += _RECORD.size + len(blob)
+        self._length += 1
+
+        # the segment is allowed two pages worth so reading a page back in and
+        # adding one value doesn't send it straight back out
+        if self._front.nbytes > 2 * self._payload_size:
+            self._spill(self._front)
+
+    def add_back(self, data):
+        """
+        Adds a value at the end of the deque
+
+        Args:
+            data: The value to add
+        """
+        blob = self._encode(data)
+        self._back.blobs.add_back(blob)
+        self._back.nbytes += _RECORD.size + len(blob)
+        self._length += 1
+
+        if self._back.nbytes > 2 * self._payload_size:
+            self._spill(self._back)
+
+    def get_front(self):
+        """
+        Returns the value at the front of the deque. Will return None in an
+        empty deque.
+
+        Returns:
+            The value at index 0 or None if there is no such value
+        """
+        if self._length == 0:
+            return None
+        return pickle.loads(self._front_segment().blobs.get_front())
+
+    def get_back(self):
+        """
+        Returns the value at the end of the deque. Will return None in an empty
+        deque.
+
+        Returns:
+            The value at the last index or None if there is no such value
+        """
+        if self._length == 0:
+            return None
+        return pickle.loads(self._back_segment().blobs.get_back())
+
+    def remove_front(self):
+        """
+        Removes the first value of the deque
+
+        Returns:
+            True if a value was removed, False if the deque was empty
+        """
+        if self._length == 0:
+            return False
+
+        segment = self._front_segment()
+        segment.nbytes -= _RECORD.size + len(segment.blobs.get_front())
+        segment.blobs.remove_front()
+        self._length -= 1
+        return True
+
+    def remove_back(self):
+        """
+        Removes the last value of the deque
+
+        Returns:
+            True if a value was removed, False if the deque was empty
+        """
+        if self._length == 0:
+            return False
+
+        segment = self._back_segment()
+        segment.nbytes -= _RECORD.size + len(segment.blobs.get_back())
+        segment.blobs.remove_back()
+        self._length -= 1
+        return True
+
+    def is_empty(self):
+        """
+        Checks if the deque is empty
+
+        Returns:
+            True if the deque has no values, False otherwise
+        """
+        return self._length == 0
+
+    def contains(self, value):
+        """
+        Checks if any value in the deque equals value, reading spilled pages
+        as needed
+
+        Args:
+            value: The value to look for
+
+        Returns:
+            True if value is in the deque, False otherwise
+        """
+        for data in self:
+            if data == value:
+                return True
+        return False
+
+    # ----- durability -----
+
+    def flush(self):
+        """
+        Writes the hot segments out to pages, records the page order in a new
+        manifest and commits it with a header write. Only then are the pages
+        given up since the last flush, and the old manifest, free for reuse.
+        """
+        while not self._front.blobs.is_empty():
+            self._spill(self._front)
+        while not self._back.blobs.is_empty():
+            self._spill(self._back)
+
+        # write the new manifest, back to front so each page knows its next
+        old_manifest = self._manifest_pages
+        self._manifest_pages = []
+        per_page = (self.page_size - _MANIFEST_HEADER.size) \
+            // _PAGE_NUMBER.size
+        pages = list(self._pages)
+        next_page = -1
+        for start in reversed(range(0, len(pages), per_page)):
+            chunk = pages[start:start + per_page]
+            page = self._allocate_page()
+            buf = _MANIFEST_HEADER.pack(next_page, len(chunk)) + \
+                b''.join([_PAGE_NUMBER.pack(number) for number in chunk])
+            offset = page * self.page_size
+            self._map[offset:offset + len(buf)] = buf
+            self._manifest_pages.insert(0, page)
+            next_page = page
+
+        # the pages have to be on disk before the header that points at them
+        self._map.flush()
+        self._write_header()
+        self._map.flush()
+
+        self._free.extend(self._released)
+        self._free.extend(old_manifest)
+        self._released = []
+
+    def close(self):
+        """
+        Flushes the deque and closes the file
+        """
+        if self._map is None:
+            return
+        self.flush()
+        self._map.close()
+        self._map = None
+        self._file.close()
@@ -0,0 +1,95 @@
+# test_circular_variants.py
+# ===================================================
+# Randomized tests checking UnrolledCircularList and IndexedCircularList
+# against CircularList
+# Run with: python -m pytest test_circular_variants.py
+# ===================================================
+
+import math
+import random
+
+import pytest
+
+from linked_list import CircularList, UnrolledCircularList, \
+    IndexedCircularList
+
+
+def _apply(lst, op, value, index):
+    """
+    Applies one operation to a list, returning its result or the fact that it
+    raised so lists can be compared on failures too
+
+    Args:
+        lst: The list to change
+        op: The name of the operation
+        value: The value to add or look for
+        index: The index for the positional operations
+
+    Returns:
+        What the operation returned, or 'raised' if it raised an Exception
+    """
+    try:
+        if op == 'add_front':
+            return lst.add_front(value)
+        if op == 'add_back':
+            return lst.add_back(value)
+        if op == 'add_link_before':
+            return lst.add_link_before(value, index)
+        if op == 'remove_link':
+            return lst.remove_link(index)
+        if op == 'remove_front':
+            return lst.remove_front()
+        if op == 'remove_back':
+            return lst.remove_back()
+        if op == 'get_front':
+            return lst.get_front()
+        if op == 'get_back':
+            return lst.get_back()
+        if op == 'getitem':
+            return lst[index]
+        if op == 'contains':
+            return lst.contains(value)
+        if op == 'remove':
+            return lst.remove(value)
+        if op == 'reverse':
+            return lst.circularListReverse()
+        raise Exception('Unknown operation ' + op)
+    except Exception:
+        return 'raised'
+
+
+OPERATIONS = ['add_front', 'add_back', 'add_link_before', 'remove_link',
+              'remove_front', 'remove_back', 'get_front', 'get_back',
+              'getitem', 'contains', 'remove', 'reverse']
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_variants_match_circular_list(seed):
+    rng = random.Random(seed)
+    # small blocks so the unrolled list splits and merges often
+    lists = [CircularList(), UnrolledCircularList(block_size=4),
+             IndexedCircularList()]
+    for _ in range(600):
+        op = rng.choice(OPERATIONS)
+        value = rng.randrange(20)
+        index = rng.randrange(-2, len(lists[0]) + 3)
+        results = [_apply(lst, op, value, index) for lst in lists]
+        assert results[1] == results[0], (op, value, index)
+        assert results[2] == results[0], (op, value, index)
+
+        expected = list(lists[0])
+        for lst in lists[1:]:
+            assert len(lst) == len(expected)
+            assert list(lst) == expected
+            assert list(reversed(lst)) == expected[::-1]
+            assert str(lst) == str(lists[0])
+            assert lst.is_empty() == (not expected)
+
+
+def test_nan_is_never_found():
+    nan = math.nan
+    for cls in (CircularList, UnrolledCircularList, IndexedCircularList):
+        lst = cls([1, nan, 2])
+        assert not lst.contains(nan), cls.__name__
+        assert not lst.remove(nan), cls.__name__
+        assert len(lst) == 3
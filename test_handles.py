@@ -0,0 +1,88 @@
+# test_handles.py
+# ===================================================
+# Tests for the node handles of CircularList
+# Run with: python -m pytest test_handles.py
+# ===================================================
+
+import pytest
+
+from linked_list import CircularList
+
+
+def test_evicted_handle_is_refused():
+    # a full list reuses the evicted Node, which must not be the one a
+    # handle still points at
+    c = CircularList(maxlen=2)
+    handle = c.add_back('a', handle=True)
+    c.add_back('b')
+    c.add_back('c')
+
+    with pytest.raises(Exception):
+        c.remove_node(handle)
+    with pytest.raises(Exception):
+        c.move_to_front(handle)
+    assert list(c) == ['b', 'c']
+    assert len(c) == 2
+
+
+def test_handles_survive_eviction_of_other_values():
+    c = CircularList(maxlen=3)
+    handles = [c.add_back(value, handle=True) for value in 'abc']
+    c.add_back('d')
+
+    assert c.remove_node(handles[2]) == 'c'
+    c.move_to_front(handles[1])
+    assert list(c) == ['b', 'd']
+
+
+def test_evicting_a_handle_node_keeps_the_new_handle_usable():
+    c = CircularList(maxlen=1)
+    first = c.add_back('a', handle=True)
+    second = c.add_back('b', handle=True)
+
+    assert second is not first
+    with pytest.raises(Exception):
+        c.remove_node(first)
+    assert c.remove_node(second) == 'b'
+    assert len(c) == 0
+
+
+def test_removed_handle_is_refused_and_other_lists_are_untouched():
+    a = CircularList(['x'])
+    b = CircularList(['z'])
+    handle = a.add_back('w', handle=True)
+
+    assert a.remove_node(handle) == 'w'
+    b.add_back('y')
+    with pytest.raises(Exception):
+        a.remove_node(handle)
+    with pytest.raises(Exception):
+        b.remove_node(handle)
+
+    assert list(a) == ['x'] and len(a) == 1
+    assert list(b) == ['z', 'y'] and len(b) == 2
+
+
+def test_handle_removed_by_value_is_refused():
+    c = CircularList([1, 2])
+    handle = c.add_front(0, handle=True)
+    c.remove_front()
+
+    with pytest.raises(Exception):
+        c.remove_node(handle)
+    assert list(c) == [1, 2]
+
+
+def test_handles_follow_their_nodes_between_lists():
+    a = CircularList()
+    b = CircularList()
+    handle = b.add_back('y', handle=True)
+    b.add_back('z')
+
+    a.concat(b)
+    with pytest.raises(Exception):
+        b.remove_node(handle)
+    assert a.remove_node(handle) == 'y'
+
+    tail = a.split_at(0)
+    assert list(tail) == ['z'] and len(a) == 0
@@ -0,0 +1,71 @@
+# test_iteration.py
+# ===================================================
+# Tests for the fail-fast iterators and slicing of the lists
+# Run with: python -m pytest test_iteration.py
+# ===================================================
+
+import pytest
+
+from linked_list import LinkedList, CircularList, UnrolledCircularList, \
+    IndexedCircularList
+
+LISTS = [LinkedList, CircularList, UnrolledCircularList, IndexedCircularList]
+
+
+@pytest.mark.parametrize('cls', LISTS)
+def test_change_before_first_step_is_caught(cls):
+    lst = cls([1, 2])
+    it = iter(lst)
+    lst.add_back(3)
+    with pytest.raises(Exception):
+        list(it)
+
+
+@pytest.mark.parametrize('cls', LISTS)
+def test_emptying_before_first_step_is_caught(cls):
+    lst = cls([1])
+    it = iter(lst)
+    lst.remove_front()
+    with pytest.raises(Exception):
+        next(it)
+
+
+@pytest.mark.parametrize('cls', [CircularList, UnrolledCircularList,
+                                 IndexedCircularList])
+def test_reversed_change_before_first_step_is_caught(cls):
+    lst = cls([1, 2])
+    it = reversed(lst)
+    lst.add_front(0)
+    with pytest.raises(Exception):
+        list(it)
+
+
+@pytest.mark.parametrize('cls', [LinkedList, CircularList])
+def test_islice_change_before_first_step_is_caught(cls):
+    lst = cls([1, 2, 3])
+    it = lst.islice(0, 2)
+    lst.remove_back()
+    with pytest.raises(Exception):
+        list(it)
+
+
+def test_numeric_deque_change_before_first_step_is_caught():
+    numeric_list = pytest.importorskip('numeric_list')
+    deque = numeric_list.NumericDeque([1, 2])
+    it = iter(deque)
+    deque.add_back(3)
+    with pytest.raises(Exception):
+        list(it)
+
+
+@pytest.mark.parametrize('cls', LISTS)
+def test_slices_match_python_lists(cls):
+    values = list(range(30))
+    lst = cls(values)
+    for sl in [slice(0, 2), slice(None), slice(3, 25, 4), slice(-5, None),
+               slice(None, None, -1), slice(20, 2, -3), slice(40, 50),
+               slice(5, 5)]:
+        part = lst[sl]
+        assert type(part) is cls
+        assert list(part) == values[sl]
+    assert list(cls()[0:2]) == []
@@ -0,0 +1,129 @@
+# test_persistent_list.py
+# ===================================================
+# Tests for PersistentDeque, including recovery after simulated crashes
+# Run with: python -m pytest test_persistent_list.py
+# ===================================================
+
+import collections
+import os
+import random
+import shutil
+
+from persistent_list import PersistentDeque, _records_size
+
+
+def _apply(deque, reference, rng):
+    """
+    Makes one random change to both deque and reference
+
+    Args:
+        deque: The PersistentDeque
+        reference: A collections.deque holding the same values
+        rng: The random.Random to pick the change with
+    """
+    op = rng.random()
+    if op < 0.3:
+        value = 'v%d' % rng.randrange(10 ** 6) * rng.randint(1, 40)
+        deque.add_back(value)
+        reference.append(value)
+    elif op < 0.55:
+        value = rng.randrange(10 ** 6)
+        deque.add_front(value)
+        reference.appendleft(value)
+    elif op < 0.8:
+        deque.remove_front()
+        if reference:
+            reference.popleft()
+    else:
+        deque.remove_back()
+        if reference:
+            reference.pop()
+
+
+def test_clean_reopen(tmp_path):
+    path = str(tmp_path / 'deque.bin')
+    with PersistentDeque(path, page_size=4096) as deque:
+        for value in range(5000):
+            deque.add_back(value)
+            deque.add_front(-value)
+
+    deque = PersistentDeque(path)
+    assert len(deque) == 10000
+    assert list(deque) == [-value for value in reversed(range(5000))] + \
+        list(range(5000))
+    deque.close()
+
+
+def test_repeated_flushes_do_not_leave_small_pages(tmp_path):
+    path = str(tmp_path / 'deque.bin')
+    deque = PersistentDeque(path, page_size=4096)
+    for value in range(1000):
+        deque.add_back(value)
+        deque.flush()
+    for value in range(1000):
+        deque.add_front(value)
+        deque.flush()
+
+    # only the two end pages may be partly filled
+    pages = list(deque._pages)
+    for page in pages[1:-1]:
+        assert _records_size(deque._read_data_page(page)) > 4096 // 2
+    assert len(pages) <= 12
+    assert os.path.getsize(path) <= 64 * 1024
+    deque.close()
+
+    deque = PersistentDeque(path)
+    assert list(deque) == list(reversed(range(1000))) + list(range(1000))
+    deque.close()
+
+
+def test_recovers_last_flush_after_crash(tmp_path):
+    rng = random.Random(1234)
+    path = str(tmp_path / 'deque.bin')
+    crashed = str(tmp_path / 'crashed.bin')
+
+    deque = PersistentDeque(path, page_size=4096)
+    reference = collections.deque()
+    flushed = []
+
+    for round_number in range(300):
+        for number in range(rng.randint(0, 200)):
+            _apply(deque, reference, rng)
+
+        if rng.random() < 0.5:
+            deque.flush()
+            flushed = list(reference)
+            continue
+
+        # a crash keeps whatever reached the file so far, unflushed pages
+        # included, but loses everything still in memory
+        deque._map.flush()
+        shutil.copyfile(path, crashed)
+        recovered = PersistentDeque(crashed)
+        assert list(recovered) == flushed
+        assert len(recovered) == len(flushed)
+        recovered.close()
+
+    deque.close()
+    deque = PersistentDeque(path)
+    assert list(deque) == list(reference)
+    deque.close()
+
+
+def test_dropped_without_close_rolls_back(tmp_path):
+    path = str(tmp_path / 'deque.bin')
+    deque = PersistentDeque(path, page_size=4096)
+    for value in range(3000):
+        deque.add_back(value)
+    deque.flush()
+
+    for value in range(1500):
+        deque.remove_front()
+        deque.add_front(-1)
+        deque.add_back(-1)
+    deque._map.close()
+    deque._file.close()
+
+    deque = PersistentDeque(path)
+    assert list(deque) == list(range(3000))
+    deque.close()